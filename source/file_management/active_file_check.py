@@ -45,6 +45,12 @@ def extract_tracking_name(tracking_path: str) -> str:
     return tracking_path.split("DLC")[0]
 
 
+def _stems(folder: str, extensions) -> list[str]:
+    """File names in a folder with one of the given extensions, without the extension."""
+    splitext = os.path.splitext
+    return [splitext(name)[0] for name in os.listdir(folder) if name.endswith(extensions)]
+
+
 def check_folders(
     source_folder: str, 
     preprocessing_folder: str, 
@@ -65,33 +71,19 @@ def check_folders(
     Returns:
         Dict mapping video names to their current status
     """
-    videos_source = [
-        Path(video).stem for video in os.listdir(source_folder) 
-        if video.endswith((".mp4", ".avi"))
-    ]
-    videos_prepro = [
-        Path(video).stem for video in os.listdir(preprocessing_folder) 
-        if video.endswith((".mp4", ".avi"))
-    ]
-    tracking = [
-        Path(f).stem for f in os.listdir(tracking_folder) 
-        if f.endswith(".csv")
-    ]
-    images = [
-        Path(f).stem for f in os.listdir(image_folder) 
-        if f.endswith((".jpg", ".png"))
-    ]
-    points = [
-        Path(point).stem for point in os.listdir(point_folder) 
-        if point.endswith(".npy")
-    ]
+    # Stem each listed name once; the status dict is keyed by these stems
+    videos_source = _stems(source_folder, (".mp4", ".avi"))
+    videos_prepro = _stems(preprocessing_folder, (".mp4", ".avi"))
+    tracking = _stems(tracking_folder, ".csv")
+    images = _stems(image_folder, (".jpg", ".png"))
+    points = set(_stems(point_folder, ".npy"))
 
     status = {video: Status.LOADED for video in videos_source}
     
     if len(videos_source):
         for video in videos_source:
             assert video in status.keys()
-            if Path(video).stem in points:
+            if video in points:
                 status[video] = Status.READY_PREPROCESS
     else:
         return status    
@@ -110,11 +102,8 @@ def check_folders(
             status[track_modified] = Status.TRACKED
             
     if len(images):
-        source_names = [Path(video).stem for video in videos_source]
         for image in images:
-            assert Path(image).stem in source_names
+            assert image in status.keys()
             status[image] = Status.RESULTS_DONE
 
     return status
-
-
@@ -0,0 +1,120 @@
+"""
+Qt-free markdown to HTML rendering for the manual dialog.
+
+Kept free of PyQt imports and plain Python only, so the string-heavy
+rendering can be compiled ahead of time (e.g. with Cython) without any
+source changes, while still importing as a normal module.
+"""
+
+import re
+from functools import lru_cache
+from html import escape as html_escape
+
+
+# Inline markdown rules as one alternation, compiled once at import, so each line is
+# scanned a single time instead of once per rule
+_INLINE_RE = re.compile(
+    r'\*\*\*(?P<bold_italic>.*?)\*\*\*'
+    r'|\*\*(?P<bold>.*?)\*\*'
+    r'|\*(?P<italic>(?:[^*]|\*\*[^*]+\*\*)+?)\*(?!\*)'  # May contain **bold**, so it cannot end inside one
+    r'|`(?P<code>[^`]+)`'
+    r'|\[(?P<link_text>[^\]]+)\]\((?P<link_url>[^)]+)\)'
+)
+_OL_RE = re.compile(r'\d+\. (.*)')
+
+# Line prefixes and the dark theme tags they render to (longest header prefix first)
+_LINE_PREFIXES = (
+    ('### ', '<h3 style="color: #4fc3f7; margin-top: 24px; margin-bottom: 12px; font-weight: 600;">', '</h3>'),
+    ('## ', '<h2 style="color: #81c784; margin-top: 28px; margin-bottom: 16px; border-bottom: 2px solid #81c784; padding-bottom: 6px; font-weight: 600;">', '</h2>'),
+    ('# ', '<h1 style="color: #ffb74d; margin-top: 32px; margin-bottom: 20px; text-align: center; border-bottom: 3px solid #ffb74d; padding-bottom: 12px; font-weight: 700;">', '</h1>'),
+    ('- ', '<ul style="margin: 12px 0; padding-left: 24px; color: #d4d4d4;"><li style="margin: 4px 0; color: #d4d4d4;">', '</li></ul>'),
+)
+_LIST_ITEM_HTML = '<li style="margin: 4px 0; color: #d4d4d4;">{}</li>'
+_CODE_BLOCK_HTML = '<pre style="background-color: #0d1117; color: #c9d1d9; padding: 16px; border-radius: 6px; overflow-x: auto; font-family: Consolas, monospace; margin: 12px 0; border: 1px solid #30363d;"><code>{}</code></pre>'
+_CODE_FENCE = '```'
+
+
+def _render_inline(line: str) -> str:
+    """Apply the inline markdown rules (bold, italic, code, links) to a single line."""
+    return _INLINE_RE.sub(_render_inline_match, line)
+
+
+def _render_inline_match(match: re.Match) -> str:
+    """Render one inline markdown match; bold, italic and link text may nest further rules."""
+    kind = match.lastgroup
+    if kind == 'bold_italic':
+        return (f'<strong style="color: #ffcc02; font-weight: 600;"><em style="color: #e1bee7;">'
+                f'{_render_inline(match["bold_italic"])}</em></strong>')
+    if kind == 'bold':
+        # Bold text with accent color
+        return f'<strong style="color: #ffcc02; font-weight: 600;">{_render_inline(match["bold"])}</strong>'
+    if kind == 'italic':
+        return f'<em style="color: #e1bee7;">{_render_inline(match["italic"])}</em>'
+    if kind == 'code':
+        # Inline code with dark theme
+        return f'<code style="background-color: #2d2d2d; color: #f8bbd9; padding: 3px 6px; border-radius: 4px; font-family: Consolas, monospace; border: 1px solid #3e3e3e;">{match["code"]}</code>'
+    # Links with accent color
+    return f'<a href="{match["link_url"]}" style="color: #58a6ff; text-decoration: none; border-bottom: 1px solid #58a6ff;">{_render_inline(match["link_text"])}</a>'
+
+
+def _render_line(line: str) -> str:
+    """Render one non-code line: block prefix (header/list item) plus inline rules."""
+    for prefix, open_tag, close_tag in _LINE_PREFIXES:
+        if line.startswith(prefix):
+            return open_tag + _render_inline(line[len(prefix):]) + close_tag
+    
+    ordered_item = _OL_RE.match(line)
+    if ordered_item:
+        return _LIST_ITEM_HTML.format(_render_inline(ordered_item.group(1)))
+    
+    return _render_inline(line)
+
+
+@lru_cache(maxsize=8)
+def markdown_to_html(markdown_text: str) -> str:
+    """
+    Convert basic markdown to HTML for display.
+    
+    Works as a single pass over the lines with a small state machine for
+    fenced code blocks, collecting the output in a list that is joined once.
+    The documentation strings are module-level constants, so the rendered
+    HTML is cached and later dialog openings skip the conversion entirely.
+    """
+    rendered = []
+    code_lines = None  # Lines of the open fenced code block, None outside of one
+    
+    for line in markdown_text.split('\n'):
+        if line.startswith(_CODE_FENCE):
+            if code_lines is None:
+                code_lines = []
+            else:
+                rendered.append(_CODE_BLOCK_HTML.format(html_escape('\n'.join(code_lines))))
+                code_lines = None
+        elif code_lines is not None:
+            code_lines.append(line)
+        else:
+            rendered.append(_render_line(line))
+    
+    if code_lines is not None:
+        # Unterminated fence: still show the collected lines as code
+        rendered.append(_CODE_BLOCK_HTML.format(html_escape('\n'.join(code_lines))))
+    
+    # Line breaks
+    html = '<br>'.join(rendered)
+    
+    # Wrap in div with dark theme styling
+    styled_html = f'''
+    <div style="
+        font-family: 'Segoe UI', 'Consolas', Tahoma, Geneva, Verdana, sans-serif;
+        line-height: 1;
+        color: #d4d4d4;
+        background-color: #1e1e1e;
+        max-width: 100%;
+        margin: 0 auto;
+        padding: 5x;
+    ">
+        {html}
+    </div>
+    '''
+    
+    return styled_html
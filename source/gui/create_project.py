@@ -1,11 +1,20 @@
 import os
+import sys
+import errno
+import time
 import ctypes
 from datetime import datetime
+from itertools import compress
 from typing import Optional
 
 import yaml
 from shutil import copy as shutil_copy
 
+try:
+    from yaml import CSafeDumper as YamlDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as YamlDumper
+
 from PyQt5.QtWidgets import (
     QHBoxLayout, 
     QComboBox, 
@@ -19,63 +28,156 @@ from PyQt5.QtWidgets import (
     QProgressDialog,
     QSpinBox,
     QListWidget,
+    QScrollArea,
     QMessageBox,
     QGroupBox,
     QTextEdit,
     QCheckBox,
 )
-from PyQt5.QtCore import Qt, Qt as QtCore, QThread, pyqtSignal
+from PyQt5.QtCore import Qt, Qt as QtCore, QThread, QThreadPool, QRunnable, QMutex, QMutexLocker, QTimer, pyqtSignal
 
 from file_management.folders import Folder, PROJECT_FOLDER
 
 
+MAX_COPY_THREADS = 8  # Concurrent copies; enough to keep an SSD/NVMe queue busy
+VALIDATE_DEBOUNCE_MS = 100  # Quiet period after the last keystroke before validating
+PROGRESS_UPDATE_INTERVAL = 1 / 30  # Minimum seconds between copy progress repaints
+PROGRESS_EMIT_EVERY = 16  # Worker reports progress at least every N copied files...
+PROGRESS_EMIT_INTERVAL = 0.05  # ...or once this many seconds passed since the last report
+PROGRESS_STEPS = 1000  # Resolution of the copy progress bar (QProgressDialog takes 32-bit ints)
+_USE_SENDFILE = sys.platform.startswith("linux")  # sendfile to regular files is Linux-only
+_HAS_FADVISE = hasattr(os, "posix_fadvise")
+
+
+def _is_same_copy(source_stat: os.stat_result, dest_path: str) -> bool:
+    """Check whether dest_path already holds a finished copy (same size and mtime)."""
+    try:
+        dest_stat = os.stat(dest_path)
+    except FileNotFoundError:
+        return False
+    return (dest_stat.st_size == source_stat.st_size
+            and dest_stat.st_mtime_ns == source_stat.st_mtime_ns)
+
+
+class _FileCopyTask(QRunnable):
+    """Copies a single file on a QThreadPool thread on behalf of a FileCopyWorker."""
+    
+    def __init__(self, worker: "FileCopyWorker", video_file: str, size: int):
+        super().__init__()
+        self.worker = worker
+        self.video_file = video_file
+        self.size = size
+    
+    def run(self):
+        self.worker._copy_one(self.video_file, self.size)
+
+
 class FileCopyWorker(QThread):
-    """Worker thread for copying files during project creation."""
+    """Worker thread for copying files during project creation.
+    
+    The files themselves are copied concurrently on a QThreadPool; this thread
+    only dispatches the per-file tasks and reports the overall outcome.
+    """
     
-    progress_update = pyqtSignal(int, int, str)  # current, total, filename
+    progress_update = pyqtSignal('qint64', 'qint64', str)  # bytes done, bytes total, filename
     copy_complete = pyqtSignal()
     error_occurred = pyqtSignal(str)
     
-    def __init__(self, source_folder: str, dest_folder: str, files_to_copy: list[str]):
+    def __init__(self, source_folder: str, dest_folder: str, files_to_copy: list[tuple[str, int]]):
         super().__init__()
         self.source_folder = source_folder
         self.dest_folder = dest_folder
-        self.files_to_copy = files_to_copy
+        self.files_to_copy = files_to_copy  # (filename, size in bytes) pairs
+        # Filenames are bare names, so joining reduces to prefixing the folder once
+        self._src_prefix = os.path.join(source_folder, "")
+        self._dst_prefix = os.path.join(dest_folder, "")
         self.should_cancel = False
+        
+        # Report progress in bytes so one large video does not look like one small one
+        self.total_bytes = sum(size for _, size in files_to_copy)
+        
+        self._mutex = QMutex()  # Guards the progress counters and _error across pool threads
+        self._completed = 0
+        self._bytes_done = 0
+        self._last_emit = 0.0
+        self._error: Optional[str] = None
     
     def cancel(self):
         """Cancel the file copying operation."""
         self.should_cancel = True
         self.requestInterruption()  # Request QThread interruption for faster response
     
+    def _is_cancelled(self) -> bool:
+        return self.should_cancel or self.isInterruptionRequested()
+    
     def run(self):
         """Run the file copying process."""
-        try:
-            for i, video_file in enumerate(self.files_to_copy):
-                if self.should_cancel or self.isInterruptionRequested():
-                    return
-                
-                # Emit progress update
-                self.progress_update.emit(i, len(self.files_to_copy), video_file)
-                
-                # Copy the file with cancellation support
-                source_path = os.path.join(self.source_folder, video_file)
-                dest_path = os.path.join(self.dest_folder, video_file)
-                
-                if not self._copy_file_with_cancel_check(source_path, dest_path):
-                    # Copy was cancelled, clean up partial file if it exists
-                    if os.path.exists(dest_path):
-                        try:
-                            os.remove(dest_path)
-                        except OSError:
-                            pass  # Ignore cleanup errors
-                    return
-            
+        pool = QThreadPool()
+        pool.setMaxThreadCount(min(MAX_COPY_THREADS, os.cpu_count() or 1))
+        
+        for video_file, size in self.files_to_copy:
+            pool.start(_FileCopyTask(self, video_file, size))
+        pool.waitForDone()
+        
+        if self._error is not None:
+            self.error_occurred.emit(f"Error copying files: {self._error}")
+        elif not self._is_cancelled():
             # Emit completion signal
             self.copy_complete.emit()
-            
+    
+    def _copy_one(self, video_file: str, size: int) -> None:
+        """Copy a single file, recording progress or the first error encountered."""
+        if self._is_cancelled():
+            return
+        
+        source_path = self._src_prefix + video_file
+        dest_path = self._dst_prefix + video_file
+        
+        try:
+            source_stat = os.stat(source_path)
+            if _is_same_copy(source_stat, dest_path):
+                # Left over from an interrupted run; nothing to do
+                video_file += " (skipped)"
+                completed = True
+            else:
+                completed = self._copy_file_with_cancel_check(source_path, dest_path)
+                if completed:
+                    # Carry the source mtime over so a later run can recognise the copy
+                    os.utime(dest_path, ns=(source_stat.st_atime_ns, source_stat.st_mtime_ns))
         except Exception as e:
-            self.error_occurred.emit(f"Error copying files: {str(e)}")
+            with QMutexLocker(self._mutex):
+                if self._error is None:
+                    self._error = str(e)
+            self.should_cancel = True  # Stop the remaining copies
+            completed = False
+        
+        if not completed:
+            # Copy was cancelled or failed, clean up partial file if it exists
+            if os.path.exists(dest_path):
+                try:
+                    os.remove(dest_path)
+                except OSError:
+                    pass  # Ignore cleanup errors
+            return
+        
+        with QMutexLocker(self._mutex):
+            self._completed += 1
+            self._bytes_done += size
+            bytes_done = self._bytes_done
+            
+            # Batch reports: each emit is a queued event the GUI thread must process
+            now = time.monotonic()
+            should_emit = (
+                self._completed % PROGRESS_EMIT_EVERY == 0
+                or now - self._last_emit > PROGRESS_EMIT_INTERVAL
+                or self._completed == len(self.files_to_copy)
+            )
+            if should_emit:
+                self._last_emit = now
+        
+        if should_emit:
+            # Signals emitted from pool threads are queued to the GUI thread
+            self.progress_update.emit(bytes_done, self.total_bytes, video_file)
     
     def _copy_file_with_cancel_check(self, source_path: str, dest_path: str, chunk_size: int = 4*1024*1024) -> bool:
         """
@@ -84,31 +186,71 @@ class FileCopyWorker(QThread):
         Args:
             source_path: Source file path
             dest_path: Destination file path
-            chunk_size: Size of each chunk to copy (default 1MB)
+            chunk_size: Size of each chunk to copy (default 4MB)
             
         Returns:
             bool: True if copy completed, False if cancelled
         """
-        try:
-            with open(source_path, 'rb') as src_file:
-                with open(dest_path, 'wb') as dest_file:
+        # The loop body must stay free of per-byte Python work: the copy syscalls
+        # below release the GIL, which keeps the GUI thread responsive during
+        # multi-GB transfers. Python objects are only touched between chunks.
+        with open(source_path, 'rb') as src_file:
+            with open(dest_path, 'wb') as dest_file:
+                use_sendfile = _USE_SENDFILE
+                if use_sendfile:
+                    # Kernel-side copy, no data passes through Python buffers
+                    in_fd, out_fd = src_file.fileno(), dest_file.fileno()
+                    if _HAS_FADVISE:
+                        # Let the kernel read ahead aggressively for the streaming copy
+                        os.posix_fadvise(in_fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                        os.posix_fadvise(out_fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                    offset = 0
                     while True:
                         # Check for cancellation before each chunk
-                        if self.should_cancel or self.isInterruptionRequested():
+                        if self._is_cancelled():
                             return False
                         
-                        # Read and copy chunk
-                        chunk = src_file.read(chunk_size)
-                        if not chunk:
+                        try:
+                            sent = os.sendfile(out_fd, in_fd, offset, chunk_size)
+                        except OSError as e:
+                            # Some filesystems (FUSE direct_io, eCryptfs, vboxsf) reject sendfile;
+                            # like shutil, fall back to the buffered copy if nothing was written yet
+                            if offset or e.errno == errno.ENOSPC:
+                                raise
+                            use_sendfile = False
+                            break
+                        if not sent:
                             break  # End of file
+                        offset += sent
+                    
+                    if use_sendfile and _HAS_FADVISE:
+                        # The videos are not re-read soon; drop them from the page cache
+                        # (dirty pages must be flushed before they can be dropped)
+                        os.posix_fadvise(in_fd, 0, 0, os.POSIX_FADV_DONTNEED)
+                        os.fdatasync(out_fd)
+                        os.posix_fadvise(out_fd, 0, 0, os.POSIX_FADV_DONTNEED)
+                
+                if not use_sendfile:
+                    # Reuse one preallocated buffer instead of allocating a bytes object per chunk
+                    buffer = bytearray(chunk_size)
+                    view = memoryview(buffer)
+                    while True:
+                        # Check for cancellation before each chunk
+                        if self._is_cancelled():
+                            return False
                         
-                        dest_file.write(chunk)
+                        read = src_file.readinto(buffer)
+                        if not read:
+                            break  # End of file
                         
-            return True
-            
-        except Exception:
-            # Re-raise the exception to be handled by the main run method
-            raise
+                        dest_file.write(view[:read])
+                    
+        return True
+
+
+def _index_field_groups(merge_groups: list[list[int]]) -> dict[int, int]:
+    """Map each merged field index to the position of its group in merge_groups."""
+    return {idx: group_id for group_id, group in enumerate(merge_groups) for idx in group}
 
 
 class MergeGroupDialog(QDialog):
@@ -164,6 +306,9 @@ class FieldMergingDialog(QDialog):
         
         self.field_names = field_names
         self.merge_groups = [group.copy() for group in existing_merge_groups]  # Deep copy
+        # Field index -> position of its group in merge_groups (O(1) membership/overlap checks)
+        self._field_to_group: dict[int, int] = _index_field_groups(self.merge_groups)
+        self._last_rendered_groups: Optional[tuple[tuple[int, ...], ...]] = None
         
         layout = QVBoxLayout()
         
@@ -237,13 +382,13 @@ class FieldMergingDialog(QDialog):
                 return
             
             # Check for overlapping merge groups
-            for existing_group in self.merge_groups:
-                if any(idx in existing_group for idx in selected_indices):
-                    QMessageBox.warning(self, "Warning", 
-                        "One or more selected fields are already in another merge group. "
-                        "Each field can only be in one merge group.")
-                    return
+            if any(idx in self._field_to_group for idx in selected_indices):
+                QMessageBox.warning(self, "Warning", 
+                    "One or more selected fields are already in another merge group. "
+                    "Each field can only be in one merge group.")
+                return
             
+            self._field_to_group.update(dict.fromkeys(selected_indices, len(self.merge_groups)))
             self.merge_groups.append(selected_indices)
             self.update_merge_display()
     
@@ -252,6 +397,7 @@ class FieldMergingDialog(QDialog):
         current_row = self.merge_list.currentRow()
         if current_row >= 0 and current_row < len(self.merge_groups):
             self.merge_groups.pop(current_row)
+            self._field_to_group = _index_field_groups(self.merge_groups)  # Later groups shift down
             self.update_merge_display()
     
     def clear_all_groups(self) -> None:
@@ -262,10 +408,17 @@ class FieldMergingDialog(QDialog):
                 QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
             if reply == QMessageBox.Yes:
                 self.merge_groups = []
+                self._field_to_group = {}
                 self.update_merge_display()
     
     def update_merge_display(self) -> None:
         """Update the merge groups display."""
+        # Field names are fixed for the dialog's lifetime, so the groups fully determine the list
+        rendered_groups = tuple(tuple(group) for group in self.merge_groups)
+        if rendered_groups == self._last_rendered_groups:
+            return
+        self._last_rendered_groups = rendered_groups
+        
         self.merge_list.clear()
         
         for i, group in enumerate(self.merge_groups):
@@ -283,6 +436,9 @@ class FieldMergingDialog(QDialog):
 class CreateProjectDialog(QDialog):
     """Dialog to create a new project."""
     
+    # Border style by validity, shared by the input fields and the OK button
+    _VALIDITY_STYLES = {True: "border: 1px solid green;", False: "border: 1px solid red;"}
+    
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
         self.setWindowTitle("Create New Project")
@@ -291,17 +447,26 @@ class CreateProjectDialog(QDialog):
 
         layout = QVBoxLayout()
 
+        # Last validity applied per widget, so unchanged styles are not re-parsed by Qt
+        self._validity_state: dict[QWidget, bool] = {}
+
+        # Coalesce bursts of keystrokes into a single validation pass
+        self._validate_timer = QTimer(self)
+        self._validate_timer.setSingleShot(True)
+        self._validate_timer.setInterval(VALIDATE_DEBOUNCE_MS)
+        self._validate_timer.timeout.connect(self._do_validate)
+
         # Project name
         layout.addWidget(QLabel("Project Name:"))
         self.project_name = QLineEdit()
         layout.addWidget(self.project_name)
-        self.project_name.textChanged.connect(self.validate)
+        self.project_name.textChanged.connect(self._schedule_validate)
 
         # Author
         layout.addWidget(QLabel("Author:"))
         self.author_name = QLineEdit()
         layout.addWidget(self.author_name)
-        self.author_name.textChanged.connect(self.validate)
+        self.author_name.textChanged.connect(self._schedule_validate)
 
         # Project type
         layout.addWidget(QLabel("Experiment type:"))
@@ -341,11 +506,17 @@ class CreateProjectDialog(QDialog):
         
         # Field names
         filename_layout.addWidget(QLabel("Field Names:"))
-        self.field_names_list = QListWidget()
-        self.field_names_list.setMaximumHeight(200)
-        # Set list item height for better visibility
-        self.field_names_list.setStyleSheet("QListWidget::item { height: 50px; }")
-        filename_layout.addWidget(self.field_names_list)
+        # Plain editors in a layout; the editor list is the authoritative source of names
+        self.field_names_container = QWidget()
+        self.field_names_layout = QVBoxLayout(self.field_names_container)
+        self.field_names_layout.setAlignment(Qt.AlignTop)
+        field_names_scroll = QScrollArea()
+        field_names_scroll.setWidgetResizable(True)
+        field_names_scroll.setMaximumHeight(200)
+        field_names_scroll.setWidget(self.field_names_container)
+        filename_layout.addWidget(field_names_scroll)
+        self._field_name_editors: list[QLineEdit] = []
+        self._field_names_cache: Optional[list[str]] = None
         
         # Field merging configuration button
         merge_button_layout = QHBoxLayout()
@@ -383,7 +554,7 @@ class CreateProjectDialog(QDialog):
         buttons_layout = QHBoxLayout()
         self.btn_ok = QPushButton("OK")
         self.btn_ok.setEnabled(False)  # disabled initially
-        self.btn_ok.setStyleSheet("border: 1px solid red;")
+        self._set_validity_style(self.btn_ok, False)
         self.btn_ok.clicked.connect(self.accept)
         btn_cancel = QPushButton("Cancel")
         btn_cancel.clicked.connect(self.reject)
@@ -396,6 +567,12 @@ class CreateProjectDialog(QDialog):
 
         # Initialize merge groups first
         self.merge_groups = []  # List of lists, each containing field indices that should be merged
+        # Precomputed (group indices, merged field name) pairs, rebuilt when names or groups change
+        self._merge_plan: list[tuple[tuple[int, ...], str]] = []
+        self._field_to_group: dict[int, int] = {}
+
+        # Cached source folder scan: (folder, mtime_ns, video files)
+        self._source_scan: Optional[tuple[str, int, list[tuple[str, int]]]] = None
 
         # Initialize field names
         self.update_field_names()
@@ -415,8 +592,18 @@ class CreateProjectDialog(QDialog):
             self.merge_groups = dialog.get_merge_groups()
             self.update_merge_status_display()
 
+    def _update_merge_plan(self, field_names: list[str]) -> None:
+        """Precompute the merged field names, which only change with the names or groups."""
+        n_names = len(field_names)
+        self._merge_plan = [
+            (tuple(group), "_".join(field_names[i] for i in group if i < n_names))
+            for group in self.merge_groups
+        ]
+        self._field_to_group = _index_field_groups(self.merge_groups)
+
     def update_merge_status_display(self) -> None:
         """Update the merge status display."""
+        self._update_merge_plan(self.get_field_names())
         if not self.merge_groups:
             self.merge_status_label.setText("No field merging configured")
             self.merge_status_label.setStyleSheet("color: #888; font-style: italic; padding: 5px;")
@@ -441,28 +628,14 @@ class CreateProjectDialog(QDialog):
         if not self.merge_groups:
             return field_names, field_values
         
-        # Create sets to track which indices are merged
-        merged_indices = set()
-        for group in self.merge_groups:
-            merged_indices.update(group)
-        
-        merged_field_names = []
-        merged_values = []
-        
-        # Add merged groups first
-        for group in self.merge_groups:
-            group_names = [field_names[i] for i in group if i < len(field_names)]
-            group_values = [field_values[i] for i in group if i < len(field_values)]
-            
-            merged_name = "_".join(group_names)
-            merged_value = "_".join(group_values)
-            
-            merged_field_names.append(merged_name)
-            merged_values.append(merged_value)
+        # Add merged groups first; their names are precomputed in _update_merge_plan
+        merged_field_names = [merged_name for _, merged_name in self._merge_plan]
+        n_values = len(field_values)
+        merged_values = ["_".join(field_values[i] for i in group if i < n_values) for group, _ in self._merge_plan]
         
         # Add non-merged fields
         for i, (name, value) in enumerate(zip(field_names, field_values)):
-            if i not in merged_indices:
+            if i not in self._field_to_group:
                 merged_field_names.append(name)
                 merged_values.append(value)
         
@@ -470,18 +643,25 @@ class CreateProjectDialog(QDialog):
 
     def update_field_names(self) -> None:
         """Update the field names list based on the number of fields."""
-        self.field_names_list.clear()
+        for editor in self._field_name_editors:
+            self.field_names_layout.removeWidget(editor)
+            editor.deleteLater()
+        self._field_name_editors = []
+        self._field_names_cache = None
         num_fields = self.num_fields_spin.value()
 
         default_names = ["Subject", "Treatment", "Dosage", "Experiment Type", "Arena", "Empty 1", "Empty 2", "Empty 3", "Empty 4", "Empty 5"]
 
         for i in range(num_fields):
             default_name = default_names[i] if i < len(default_names) else f"field_{i+1}"
-            item = QLineEdit(default_name)
-            item.textChanged.connect(self.validate)
-            item.textChanged.connect(self.update_merge_status_display)
-            self.field_names_list.addItem("")
-            self.field_names_list.setItemWidget(self.field_names_list.item(i), item)
+            editor = QLineEdit(default_name)
+            editor.setMinimumHeight(40)
+            # Invalidate the cache first so the slots below see the new text
+            editor.textChanged.connect(self._invalidate_field_names)
+            editor.textChanged.connect(self._schedule_validate)
+            editor.textChanged.connect(self.update_merge_status_display)
+            self.field_names_layout.addWidget(editor)
+            self._field_name_editors.append(editor)
         
         # Clear merge groups if field count changed significantly
         max_field_idx = max([max(group) for group in self.merge_groups] + [-1])
@@ -491,14 +671,40 @@ class CreateProjectDialog(QDialog):
         self.update_merge_status_display()
         self.validate()
 
+    def _invalidate_field_names(self) -> None:
+        """Drop the cached field names after a field name editor changed."""
+        self._field_names_cache = None
+
     def get_field_names(self) -> list[str]:
         """Get the current field names from the list."""
-        field_names = []
-        for i in range(self.field_names_list.count()):
-            widget = self.field_names_list.itemWidget(self.field_names_list.item(i))
-            if isinstance(widget, QLineEdit):
-                field_names.append(widget.text().strip())
-        return field_names
+        if self._field_names_cache is None:
+            self._field_names_cache = [editor.text().strip() for editor in self._field_name_editors]
+        return list(self._field_names_cache)
+
+    def _scan_source_folder(self) -> list[tuple[str, int]]:
+        """
+        List the video files (.mp4, .avi) in the selected source folder.
+        
+        The result is memoized on the folder's mtime so validating and then
+        creating the project only scans the directory once. Sizes come from
+        the DirEntry stat, which the directory listing often already provides.
+        
+        Returns:
+            list[tuple[str, int]]: (filename, size in bytes) for each video
+        """
+        folder = self.folder_field.text()
+        mtime_ns = os.stat(folder).st_mtime_ns
+        if self._source_scan is not None and self._source_scan[:2] == (folder, mtime_ns):
+            return self._source_scan[2]
+        
+        with os.scandir(folder) as entries:
+            video_files = [
+                (entry.name, entry.stat().st_size) for entry in entries
+                if entry.name.endswith(('.mp4', '.avi')) and entry.is_file()
+            ]
+        
+        self._source_scan = (folder, mtime_ns, video_files)
+        return video_files
 
     def validate_filenames(self) -> None:
         """Validate that all video filenames can be split correctly."""
@@ -507,10 +713,7 @@ class CreateProjectDialog(QDialog):
             return
         
         try:
-            source_video_files = [
-                vid for vid in os.listdir(self.folder_field.text()) 
-                if vid.endswith(('.mp4', '.avi'))
-            ]
+            source_video_files = [name for name, _ in self._scan_source_folder()]
             
             if not source_video_files:
                 self.preview_text.setText("No video files (.mp4, .avi) found in the selected folder.")
@@ -519,18 +722,16 @@ class CreateProjectDialog(QDialog):
             expected_fields = self.num_fields_spin.value()
             field_names = self.get_field_names()
             
-            valid_files = []
-            invalid_files = []
+            # Count separators instead of splitting every name into its parts
+            underscore_counts = [os.path.splitext(f)[0].count('_') for f in source_video_files]
+            valid_mask = [count == expected_fields - 1 for count in underscore_counts]
             
-            for video_file in source_video_files:
-                # Remove extension and split by underscore
-                name_without_ext = os.path.splitext(video_file)[0]
-                parts = name_without_ext.split('_')
-                
-                if len(parts) == expected_fields:
-                    valid_files.append(video_file)
-                else:
-                    invalid_files.append(f"{video_file} (has {len(parts)} fields, expected {expected_fields})")
+            valid_files = list(compress(source_video_files, valid_mask))
+            invalid_files = [
+                f"{video_file} (has {count + 1} fields, expected {expected_fields})"
+                for video_file, count, valid in zip(source_video_files, underscore_counts, valid_mask)
+                if not valid
+            ]
             
             # Display results
             result_text = f"Found {len(source_video_files)} video files:\n"
@@ -585,11 +786,7 @@ class CreateProjectDialog(QDialog):
         
         self.btn_ok.setEnabled(enabled)
         self.validate_btn.setEnabled(bool(text_folder.strip()))
-        
-        if enabled:
-            self.btn_ok.setStyleSheet("border: 1px solid green;")
-        else:
-            self.btn_ok.setStyleSheet("border: 1px solid red;")
+        self._set_validity_style(self.btn_ok, enabled)
 
     def select_folder(self) -> None:
         """Open a dialog to select the source folder."""
@@ -599,7 +796,24 @@ class CreateProjectDialog(QDialog):
             self.preview_text.clear()  # Clear previous validation results
             self.validate()  # validate after setting folder
 
+    def _schedule_validate(self) -> None:
+        """(Re)start the debounce timer; validation runs once typing pauses."""
+        self._validate_timer.start()
+
     def validate(self) -> None:
+        """Validate all input fields immediately, dropping any pending debounced run."""
+        self._validate_timer.stop()
+        self._do_validate()
+
+    def accept(self) -> None:
+        """Accept the dialog only if the inputs are valid, flushing any pending validation."""
+        if self._validate_timer.isActive():
+            self.validate()
+        if not self.btn_ok.isEnabled():
+            return
+        super().accept()
+
+    def _do_validate(self) -> None:
         """Validate all input fields and update UI accordingly."""
         # Read current texts
         name = self.project_name.text()
@@ -616,10 +830,14 @@ class CreateProjectDialog(QDialog):
 
     def set_field_color(self, field: QLineEdit, text: str) -> None:
         """Set the border color of a field based on whether it has text."""
-        if text.strip():
-            field.setStyleSheet("border: 1px solid green;")
-        else:
-            field.setStyleSheet("border: 1px solid red;")
+        self._set_validity_style(field, bool(text.strip()))
+
+    def _set_validity_style(self, widget: QWidget, valid: bool) -> None:
+        """Apply the green/red border style, skipping the restyle if validity is unchanged."""
+        if self._validity_state.get(widget) is valid:
+            return
+        self._validity_state[widget] = valid
+        widget.setStyleSheet(self._VALIDITY_STYLES[valid])
 
 
 def create_project_folder(dialog: CreateProjectDialog) -> str:
@@ -660,23 +878,12 @@ def create_project_folder(dialog: CreateProjectDialog) -> str:
     merge_groups = dialog.get_merge_groups()
     
     # Video copy to project folder with validation
-    source_video_files = [
-        vid for vid in os.listdir(dialog.folder_field.text()) 
-        if vid.endswith(('.mp4', '.avi'))
-    ]
+    source_video_files = dialog._scan_source_folder()
     
     # Validate all filenames before copying
-    invalid_files = []
-    valid_files = []
-    
-    for video_file in source_video_files:
-        name_without_ext = os.path.splitext(video_file)[0]
-        parts = name_without_ext.split('_')
-        
-        if len(parts) == expected_fields:
-            valid_files.append(video_file)
-        else:
-            invalid_files.append(video_file)
+    valid_mask = [os.path.splitext(f)[0].count('_') == expected_fields - 1 for f, _ in source_video_files]
+    valid_files = list(compress(source_video_files, valid_mask))
+    invalid_files = [f for (f, _), valid in zip(source_video_files, valid_mask) if not valid]
     
     if invalid_files:
         # Clean up the created project folder
@@ -720,19 +927,19 @@ def create_project_folder(dialog: CreateProjectDialog) -> str:
     yaml_path = os.path.join(project_path, "config.yaml")
     
     with open(yaml_path, 'w') as f:
-        yaml.dump(yaml_dict, f, default_flow_style=False, allow_unicode=True)
+        yaml.dump(yaml_dict, f, Dumper=YamlDumper, default_flow_style=False, allow_unicode=True)
     
     return yaml_path
 
 
-def _copy_files_threaded(source_folder: str, dest_folder: str, files_to_copy: list[str], parent_dialog) -> bool:
+def _copy_files_threaded(source_folder: str, dest_folder: str, files_to_copy: list[tuple[str, int]], parent_dialog) -> bool:
     """
     Copy files using a background thread with progress dialog.
     
     Args:
         source_folder: Source directory path
         dest_folder: Destination directory path  
-        files_to_copy: List of filenames to copy
+        files_to_copy: List of (filename, size in bytes) pairs to copy
         parent_dialog: Parent dialog for progress display
         
     Returns:
@@ -743,7 +950,7 @@ def _copy_files_threaded(source_folder: str, dest_folder: str, files_to_copy: li
         "Copying video files to project folder...", 
         "Cancel", 
         0, 
-        len(files_to_copy),
+        PROGRESS_STEPS,
         parent_dialog
     )
     progress_dialog.setWindowTitle("Creating Project")
@@ -755,21 +962,33 @@ def _copy_files_threaded(source_folder: str, dest_folder: str, files_to_copy: li
     
     # Track completion status
     copy_success = [False]  # Use list to allow modification in nested functions
-    copy_error = [None]  # type: list[Optional[str]]
+    copy_error: list[Optional[str]] = [None]
+    
+    last_update = [0.0]  # monotonic time of the last repaint
+    last_filename: list[Optional[str]] = [None]
     
-    def on_progress_update(current: int, total: int, filename: str):
+    def on_progress_update(bytes_done: int, bytes_total: int, filename: str):
         """Handle progress updates from the worker thread."""
-        progress_dialog.setLabelText(f"Copying: {filename}")
-        progress_dialog.setValue(current)
-        
         # Check if user cancelled
         if progress_dialog.wasCanceled():
             copy_worker.cancel()
+            return
+        
+        # Throttle repaints; many small files would otherwise flood the GUI thread
+        now = time.monotonic()
+        if now - last_update[0] < PROGRESS_UPDATE_INTERVAL and bytes_done != bytes_total:
+            return
+        last_update[0] = now
+        
+        if filename != last_filename[0]:
+            last_filename[0] = filename
+            progress_dialog.setLabelText(f"Copied: {filename}")
+        progress_dialog.setValue(bytes_done * PROGRESS_STEPS // bytes_total if bytes_total else PROGRESS_STEPS)
     
     def on_copy_complete():
         """Handle successful completion of file copying."""
         copy_success[0] = True
-        progress_dialog.setValue(len(files_to_copy))  # Complete
+        progress_dialog.setValue(PROGRESS_STEPS)  # Complete
         progress_dialog.accept()  # Close dialog
     
     def on_copy_error(error_message: str):
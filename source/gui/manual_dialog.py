@@ -2,13 +2,13 @@
 Manual dialog for displaying README and documentation content within the application.
 """
 
-import re
 from typing import Optional
 
 from PyQt5.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QTextEdit, QPushButton, QWidget, QLabel, QTabWidget
 )
 from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QColor, QFont, QTextBlockFormat, QTextCharFormat, QTextCursor, QTextDocument, QTextFormat
 
 # Import embedded documentation content
 from documentation.readme_content import README_CONTENT
@@ -16,6 +16,111 @@ from documentation.statistical_analysis_manual import STATISTICAL_ANALYSIS_MANUA
 from documentation.field_merging_guide import FIELD_MERGING_GUIDE_CONTENT
 from documentation.tukey_hsd_update import TUKEY_HSD_UPDATE_CONTENT
 
+from gui._markdown_render import markdown_to_html
+
+
+# Dark theme for the documentation text views, applied once to the whole dialog
+STYLESHEET = """
+QTextEdit {
+    background-color: #1e1e1e;
+    color: #d4d4d4;
+    border: 1px solid #3e3e3e;
+    border-radius: 6px;
+    padding: 16px;
+    font-family: 'Segoe UI', 'Consolas', sans-serif;
+    font-size: 18px;
+    line-height: 1;
+    selection-background-color: #264f78;
+    selection-color: #ffffff;
+}
+QScrollBar:vertical {
+    background-color: #2d2d2d;
+    width: 12px;
+    border-radius: 6px;
+}
+QScrollBar::handle:vertical {
+    background-color: #555555;
+    border-radius: 6px;
+    min-height: 20px;
+}
+QScrollBar::handle:vertical:hover {
+    background-color: #6d6d6d;
+}
+"""
+
+# Qt >= 5.14 ships a C++ markdown parser; markdown_to_html remains the fallback
+_HAS_QT_MARKDOWN = hasattr(QTextDocument, 'MarkdownDialectGitHub')
+
+# Rendered documentation per tab title, parsed once and cloned into each dialog
+_DOCUMENT_CACHE: dict[str, QTextDocument] = {}
+
+# Dark theme colors matching the markdown_to_html styling
+_HEADING_COLORS = {1: "#ffb74d", 2: "#81c784", 3: "#4fc3f7"}
+_BOLD_COLOR = "#ffcc02"
+_ITALIC_COLOR = "#e1bee7"
+_LINK_COLOR = "#58a6ff"
+_INLINE_CODE_COLOR = "#f8bbd9"
+_INLINE_CODE_BACKGROUND = "#2d2d2d"
+_CODE_BLOCK_COLOR = "#c9d1d9"
+_CODE_BLOCK_BACKGROUND = "#0d1117"
+
+
+def apply_dark_markdown_theme(document: QTextDocument) -> None:
+    """
+    Color a document produced by QTextDocument.setMarkdown for the dark theme.
+    
+    The markdown importer builds text formats directly rather than going
+    through CSS, so the colors are merged into the existing formats.
+    """
+    cursor = QTextCursor(document)
+    cursor.beginEditBlock()
+    
+    block = document.begin()
+    while block.isValid():
+        block_format = block.blockFormat()
+        heading_color = _HEADING_COLORS.get(block_format.headingLevel())
+        
+        if block_format.hasProperty(QTextFormat.BlockCodeFence) or block_format.nonBreakableLines():
+            # Fenced or indented code block
+            code_block_format = QTextBlockFormat()
+            code_block_format.setBackground(QColor(_CODE_BLOCK_BACKGROUND))
+            cursor.setPosition(block.position())
+            cursor.mergeBlockFormat(code_block_format)
+            _merge_foreground(cursor, block.position(), block.length() - 1, _CODE_BLOCK_COLOR)
+        elif heading_color is not None:
+            _merge_foreground(cursor, block.position(), block.length() - 1, heading_color)
+        else:
+            for format_range in block.textFormats():
+                char_format = format_range.format
+                start = block.position() + format_range.start
+                if char_format.isAnchor():
+                    _merge_foreground(cursor, start, format_range.length, _LINK_COLOR)
+                elif char_format.fontFixedPitch():
+                    _merge_foreground(cursor, start, format_range.length, _INLINE_CODE_COLOR,
+                                      _INLINE_CODE_BACKGROUND)
+                elif char_format.fontWeight() > QFont.Normal:
+                    _merge_foreground(cursor, start, format_range.length, _BOLD_COLOR)
+                elif char_format.fontItalic():
+                    _merge_foreground(cursor, start, format_range.length, _ITALIC_COLOR)
+        
+        block = block.next()
+    
+    cursor.endEditBlock()
+
+
+def _merge_foreground(cursor: QTextCursor, start: int, length: int, color: str,
+                      background: Optional[str] = None) -> None:
+    """Merge a text color (and optionally a background) into a span of the document."""
+    if length <= 0:
+        return
+    char_format = QTextCharFormat()
+    char_format.setForeground(QColor(color))
+    if background is not None:
+        char_format.setBackground(QColor(background))
+    cursor.setPosition(start)
+    cursor.setPosition(start + length, QTextCursor.KeepAnchor)
+    cursor.mergeCharFormat(char_format)
+
 
 class ManualDialog(QDialog):
     """Dialog for displaying formatted documentation content."""
@@ -33,6 +138,9 @@ class ManualDialog(QDialog):
         """Setup the user interface with tabs for different documents."""
         layout = QVBoxLayout()
         
+        # Set styling for dark theme; cascades to every documentation tab
+        self.setStyleSheet(STYLESHEET)
+        
         # Create tab widget for different documentation
         self.tab_widget = QTabWidget()
         
@@ -58,15 +166,48 @@ class ManualDialog(QDialog):
             ("📈 Tukey HSD Update", TUKEY_HSD_UPDATE_CONTENT)
         ]
         
+        # Only placeholders up front; each tab is built the first time it is shown
+        self._pending_docs: dict[int, tuple[str, str]] = {}
         for tab_name, content in docs:
-            try:
-                # Create tab with formatted content
-                tab_widget = self.create_documentation_tab(content, tab_name)
-                self.tab_widget.addTab(tab_widget, tab_name)
-                
-            except Exception as e:
-                error_widget = self.create_error_tab(f"Error loading {tab_name}: {str(e)}")
-                self.tab_widget.addTab(error_widget, tab_name)
+            index = self.tab_widget.addTab(self.create_placeholder_tab(), tab_name)
+            self._pending_docs[index] = (tab_name, content)
+        
+        self.tab_widget.currentChanged.connect(self._materialize_tab)
+        self._materialize_tab(self.tab_widget.currentIndex())
+    
+    def _materialize_tab(self, index: int) -> None:
+        """Replace a placeholder tab with its rendered documentation on first selection."""
+        pending = self._pending_docs.pop(index, None)
+        if pending is None:
+            return
+        tab_name, content = pending
+        
+        try:
+            # Create tab with formatted content
+            tab_widget = self.create_documentation_tab(content, tab_name)
+        except Exception as e:
+            tab_widget = self.create_error_tab(f"Error loading {tab_name}: {str(e)}")
+        
+        # Swap without re-entering this slot through currentChanged
+        self.tab_widget.blockSignals(True)
+        placeholder = self.tab_widget.widget(index)
+        self.tab_widget.removeTab(index)
+        self.tab_widget.insertTab(index, tab_widget, tab_name)
+        self.tab_widget.setCurrentIndex(index)
+        self.tab_widget.blockSignals(False)
+        placeholder.deleteLater()
+    
+    def create_placeholder_tab(self) -> QWidget:
+        """Create a lightweight stand-in for a tab that has not been rendered yet."""
+        tab = QWidget()
+        layout = QVBoxLayout()
+        
+        loading_label = QLabel("Loading...")
+        loading_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        
+        layout.addWidget(loading_label)
+        tab.setLayout(layout)
+        return tab
     
     def create_documentation_tab(self, markdown_content: str, title: str) -> QWidget:
         """Create a tab widget with formatted documentation content."""
@@ -77,43 +218,28 @@ class ManualDialog(QDialog):
         text_display = QTextEdit()
         text_display.setReadOnly(True)
         
-        # Convert markdown to HTML for better formatting
-        html_content = self.markdown_to_html(markdown_content)
-        text_display.setHtml(html_content)
-        
-        # Set styling for dark theme
-        text_display.setStyleSheet("""
-            QTextEdit {
-                background-color: #1e1e1e;
-                color: #d4d4d4;
-                border: 1px solid #3e3e3e;
-                border-radius: 6px;
-                padding: 16px;
-                font-family: 'Segoe UI', 'Consolas', sans-serif;
-                font-size: 18px;
-                line-height: 1;
-                selection-background-color: #264f78;
-                selection-color: #ffffff;
-            }
-            QScrollBar:vertical {
-                background-color: #2d2d2d;
-                width: 12px;
-                border-radius: 6px;
-            }
-            QScrollBar::handle:vertical {
-                background-color: #555555;
-                border-radius: 6px;
-                min-height: 20px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background-color: #6d6d6d;
-            }
-        """)
+        # Each tab gets its own copy of the cached document, so the text edit owns it
+        text_display.setDocument(self.rendered_document(markdown_content, title).clone(text_display))
         
         layout.addWidget(text_display)
         tab.setLayout(layout)
         return tab
     
+    def rendered_document(self, markdown_content: str, title: str) -> QTextDocument:
+        """Return the rendered document for a documentation tab, parsing it only once."""
+        document = _DOCUMENT_CACHE.get(title)
+        if document is None:
+            document = QTextDocument()
+            if _HAS_QT_MARKDOWN:
+                # Parse with Qt's native markdown importer, then apply the dark theme colors
+                document.setMarkdown(markdown_content, QTextDocument.MarkdownDialectGitHub)
+                apply_dark_markdown_theme(document)
+            else:
+                # Convert markdown to HTML for better formatting
+                document.setHtml(self.markdown_to_html(markdown_content))
+            _DOCUMENT_CACHE[title] = document
+        return document
+    
     def create_error_tab(self, error_message: str) -> QWidget:
         """Create a tab showing an error message."""
         tab = QWidget()
@@ -129,55 +255,7 @@ class ManualDialog(QDialog):
     
     def markdown_to_html(self, markdown_text: str) -> str:
         """Convert basic markdown to HTML for display."""
-        html = markdown_text
-        
-        # Headers with dark theme colors
-        html = re.sub(r'^### (.*$)', r'<h3 style="color: #4fc3f7; margin-top: 24px; margin-bottom: 12px; font-weight: 600;">\1</h3>', html, flags=re.MULTILINE)
-        html = re.sub(r'^## (.*$)', r'<h2 style="color: #81c784; margin-top: 28px; margin-bottom: 16px; border-bottom: 2px solid #81c784; padding-bottom: 6px; font-weight: 600;">\1</h2>', html, flags=re.MULTILINE)
-        html = re.sub(r'^# (.*$)', r'<h1 style="color: #ffb74d; margin-top: 32px; margin-bottom: 20px; text-align: center; border-bottom: 3px solid #ffb74d; padding-bottom: 12px; font-weight: 700;">\1</h1>', html, flags=re.MULTILINE)
-        
-        # Bold text with accent color
-        html = re.sub(r'\*\*(.*?)\*\*', r'<strong style="color: #ffcc02; font-weight: 600;">\1</strong>', html)
-        
-        # Italic text
-        html = re.sub(r'\*(.*?)\*', r'<em style="color: #e1bee7;">\1</em>', html)
-        
-        # Inline code with dark theme
-        html = re.sub(r'`([^`]+)`', r'<code style="background-color: #2d2d2d; color: #f8bbd9; padding: 3px 6px; border-radius: 4px; font-family: Consolas, monospace; border: 1px solid #3e3e3e;">\1</code>', html)
-        
-        # Code blocks with dark theme
-        html = re.sub(r'```([\s\S]*?)```', r'<pre style="background-color: #0d1117; color: #c9d1d9; padding: 16px; border-radius: 6px; overflow-x: auto; font-family: Consolas, monospace; margin: 12px 0; border: 1px solid #30363d;"><code>\1</code></pre>', html, flags=re.DOTALL)
-        
-        # Lists (unordered) with dark theme
-        html = re.sub(r'^- (.*$)', r'<li style="margin: 4px 0; color: #d4d4d4;">\1</li>', html, flags=re.MULTILINE)
-        html = re.sub(r'(<li.*?</li>)', r'<ul style="margin: 12px 0; padding-left: 24px; color: #d4d4d4;">\1</ul>', html, flags=re.DOTALL)
-        
-        # Lists (ordered)
-        html = re.sub(r'^\d+\. (.*$)', r'<li style="margin: 4px 0; color: #d4d4d4;">\1</li>', html, flags=re.MULTILINE)
-        
-        # Links with accent color
-        html = re.sub(r'\[([^\]]+)\]\(([^)]+)\)', r'<a href="\2" style="color: #58a6ff; text-decoration: none; border-bottom: 1px solid #58a6ff;">\1</a>', html)
-        
-        # Line breaks
-        html = html.replace('\n\n', '<br><br>')
-        html = html.replace('\n', '<br>')
-        
-        # Wrap in div with dark theme styling
-        styled_html = f'''
-        <div style="
-            font-family: 'Segoe UI', 'Consolas', Tahoma, Geneva, Verdana, sans-serif;
-            line-height: 1;
-            color: #d4d4d4;
-            background-color: #1e1e1e;
-            max-width: 100%;
-            margin: 0 auto;
-            padding: 5x;
-        ">
-            {html}
-        </div>
-        '''
-        
-        return styled_html
+        return markdown_to_html(markdown_text)
 
 
 def show_manual_dialog(parent: Optional[QWidget] = None) -> None:
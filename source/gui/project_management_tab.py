@@ -2,16 +2,15 @@
 Project Management Tab for the Video Tracking Application.
 """
 
+import mmap
 import os
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional
+from typing import TYPE_CHECKING, Dict, Optional
 
-import pandas as pd
-import yaml
-from pandas import DataFrame
-from PyQt5.QtCore import Qt, QTimer
-from PyQt5.QtGui import QFont, QColor
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
+from PyQt5.QtGui import QBrush, QFont, QColor
 from PyQt5.QtWidgets import (
     QAbstractItemView,
     QDialog,
@@ -21,12 +20,12 @@ from PyQt5.QtWidgets import (
     QLabel,
     QLineEdit,
     QMessageBox,
+    QProgressDialog,
     QPushButton,
     QScrollArea,
     QSizePolicy,
     QSpacerItem,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QTextEdit,
     QVBoxLayout,
     QWidget,
@@ -37,7 +36,439 @@ from file_management.status import Status
 from file_management.folders import Folder, PROJECT_FOLDER
 from gui.create_project import CreateProjectDialog, create_project_folder
 from gui.scaling import get_scaling_manager
-from gui.style import STATUS_COLORS
+from gui.style import STATUS_COLORS_BY_ENUM
+from utils.logging_config import get_logger
+
+if TYPE_CHECKING:
+    from pandas import DataFrame
+
+logger = get_logger(__name__)
+
+
+def read_project_yaml(file_path: str):
+    """
+    Parse a project YAML file from a read-only memory map.
+    
+    The mapped bytes go straight to the (libyaml when available) loader,
+    without first being read and decoded into a Python string.
+    
+    Args:
+        file_path: Path to the YAML file
+        
+    Returns:
+        The parsed YAML document (None for an empty file)
+    """
+    # Imported on first project load rather than when the tab is built
+    import yaml
+    try:
+        from yaml import CSafeLoader as YamlLoader
+    except ImportError:  # PyYAML built without libyaml
+        from yaml import SafeLoader as YamlLoader
+    
+    with open(file_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return None  # mmap cannot map an empty file
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return yaml.load(mm, Loader=YamlLoader)
+
+
+def format_creation_time(creation_time) -> str:
+    """
+    Format a project's creation time as 'dd.mm.YYYY HH:MM'.
+    
+    Args:
+        creation_time: Value stored in the config (datetime or ISO string)
+        
+    Returns:
+        str: The formatted timestamp
+    """
+    timestamp_str = str(creation_time)
+    if len(timestamp_str) >= 16 and timestamp_str[4] == '-' and timestamp_str[7] == '-':
+        # ISO 'YYYY-MM-DD[T ]HH:MM...': reorder the fields without a datetime round trip
+        return (f"{timestamp_str[8:10]}.{timestamp_str[5:7]}.{timestamp_str[0:4]} "
+                f"{timestamp_str[11:13]}:{timestamp_str[14:16]}")
+    return datetime.fromisoformat(timestamp_str).strftime("%d.%m.%Y %H:%M")
+
+
+def project_display_fields(data: dict) -> dict[str, str]:
+    """
+    Build the text of the project detail fields from a loaded project config.
+    
+    Called on the project load worker, so the GUI thread only assigns strings.
+    
+    Args:
+        data: Parsed project YAML
+        
+    Returns:
+        dict: Text for the project_name, author, experiment_type, creation_time
+        and filename_structure fields
+    """
+    creation_time = data.get("creation_time", "")
+    try:
+        creation_time_text = format_creation_time(creation_time)
+    except ValueError:  # Not a timestamp; show it as stored
+        creation_time_text = str(creation_time)
+    
+    # Display filename structure information
+    filename_structure = data.get("filename_structure", {})
+    if filename_structure:
+        field_names = filename_structure.get("field_names", [])
+        num_fields = filename_structure.get("num_fields", len(field_names))
+        merge_groups = filename_structure.get("merge_groups", [])
+        
+        # Only build the fallback description when the project does not store one
+        description = filename_structure.get("description")
+        if description is None:
+            description = f"{num_fields} fields: " + " _ ".join(field_names)
+        
+        # Add merge groups information if they exist
+        if merge_groups:
+            description += "\n\nField Merging:"
+            for i, group in enumerate(merge_groups):
+                group_names = [field_names[idx] for idx in group if idx < len(field_names)]
+                merge_name = " + ".join(group_names)
+                description += f"\n  Group {i+1}: {merge_name}"
+    else:
+        description = "No filename structure defined"
+    
+    return {
+        "project_name": str(data.get("project_name", "")),
+        "author": str(data.get("author", "")),
+        "experiment_type": str(data.get("experiment_type", "")),
+        "creation_time": creation_time_text,
+        "filename_structure": description,
+    }
+
+
+def _status_folders(folder_path: str) -> tuple[str, str, str, str, str]:
+    """Project folders scanned for file statuses, in check_folders argument order."""
+    return (
+        os.path.join(folder_path, Folder.VIDEOS.value),
+        os.path.join(folder_path, Folder.VIDEOS_PREPROCESSED.value),
+        os.path.join(folder_path, Folder.TRACKING.value),
+        os.path.join(folder_path, Folder.POINTS.value),
+        os.path.join(folder_path, Folder.IMAGES.value),
+    )
+
+
+def _folders_signature(folders: tuple[str, ...]) -> tuple:
+    """
+    Cache key for a check_folders result.
+    
+    A folder's mtime changes whenever a file is added, removed or renamed in it,
+    which is all check_folders looks at.
+    """
+    return tuple((folder, os.stat(folder).st_mtime_ns) for folder in folders)
+
+
+class _StatusScanSignals(QObject):
+    """Signals reporting the outcome of a _StatusScanTask."""
+    
+    done = pyqtSignal(str, object, object)  # project folder, cache key, status
+    failed = pyqtSignal(str)
+
+
+class _StatusScanTask(QRunnable):
+    """Scans a project's folders for file statuses off the GUI thread."""
+    
+    def __init__(self, folder_path: str, folder_cache: Optional[tuple[tuple, Dict[str, Status]]]):
+        super().__init__()
+        self.folder_path = folder_path
+        self.folder_cache = folder_cache
+        self.signals = _StatusScanSignals()
+    
+    def run(self):
+        try:
+            folders = _status_folders(self.folder_path)
+            cache_key = _folders_signature(folders)
+            if self.folder_cache is not None and self.folder_cache[0] == cache_key:
+                status = self.folder_cache[1]
+            else:
+                status = check_folders(*folders)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        
+        self.signals.done.emit(self.folder_path, cache_key, status)
+
+
+class _ProjectLoadSignals(QObject):
+    """Signals reporting the outcome of a _ProjectLoadTask."""
+    
+    loaded = pyqtSignal(str, object, object, object)  # yaml path, display fields, metrics dataframe, (cache key, status)
+    failed = pyqtSignal(str)
+
+
+class _ProjectLoadTask(QRunnable):
+    """Reads a project's YAML, metrics CSV and folder statuses off the GUI thread."""
+    
+    def __init__(self, file_path: str):
+        super().__init__()
+        self.file_path = file_path
+        self.signals = _ProjectLoadSignals()
+    
+    def run(self):
+        try:
+            fields = project_display_fields(read_project_yaml(self.file_path))
+            folder_path = os.path.dirname(self.file_path)
+            
+            # Imported here so pandas is only loaded once a project is opened
+            from metric_calculation.utils import load_metric_dataframe
+            metrics_dataframe = load_metric_dataframe(os.path.join(folder_path, Folder.RESULTS.value))
+            
+            folders = _status_folders(folder_path)
+            folder_scan = (_folders_signature(folders), check_folders(*folders))
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        
+        self.signals.loaded.emit(self.file_path, fields, metrics_dataframe, folder_scan)
+
+
+# Quick-start guide shown in the "User Manual" box
+_MANUAL_TEXT = """📖 How to use this application:
+
+🎯 1. Project Management:
+   • Create a new project or load an existing one
+   • For new projects, fill in project details and select videos
+   • Configure filename structure for organized data
+   • Filename structure enables statistical analysis grouping
+
+🎬 2. Video Points Annotation:
+   • Switch to tab 2 after creating/loading a project
+   • Mark 4 corner points of the arena for each video:
+     - Top-left (red) • Top-right (green)
+     - Bottom-right (blue) • Bottom-left (orange)
+   • Use arrow keys to navigate between videos
+   • Press 'R' to reset points, 'S' to save progress
+   • Click 'Process data on computational cluster' when done
+   ⚠️ Note: This process may take a while!
+
+🔬 3. Tracking & Analysis:
+   • Switch to tab 3 after preprocessing is complete
+   • Click 'Run Tracking on Cluster' to start pose estimation
+   • Calculate behavioral metrics and view results
+   • Export trajectory visualizations and CSV data
+   ⚠️ Note: This process may take time (even days for large datasets)
+
+📊 4. Statistical Analysis:
+   • Switch to tab 4 after metrics are calculated
+   • Load CSV data with automatically parsed filename components
+   • Choose statistical test type:
+     - t-test: Compare 2 groups (e.g., Control vs Treatment)
+     - One-way ANOVA: Compare 2+ groups with one factor
+     - Two-way ANOVA: Analyze two factors + their interaction
+   • Select grouping factors from your filename structure
+   • Choose behavioral metrics to analyze
+   • View comprehensive results with significance testing
+   • Export publication-ready statistical reports
+
+💡 Tips:
+   • Ensure all videos are properly annotated before processing
+   • Check file status in the progress table below
+   • Use consistent lighting and camera angles for best results
+   • Plan filename structure carefully for statistical analysis
+   • Balance group sizes for optimal statistical power
+   • See Statistical Analysis Manual for detailed guidance
+"""
+
+# Stylesheet for the "Create New Project" button
+_BTN_CREATE_QSS = """
+QPushButton {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                stop:0 #4CAF50, stop:1 #388E3C);
+    border: 2px solid #66BB6A;
+    border-radius: 10px;
+    color: white;
+    padding: 8px 16px;
+}
+QPushButton:hover {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                stop:0 #66BB6A, stop:1 #4CAF50);
+    border: 2px solid #81C784;
+}
+QPushButton:pressed {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                stop:0 #388E3C, stop:1 #2E7D32);
+}
+"""
+
+# Stylesheet for the "Load Existing Project" button
+_BTN_LOAD_QSS = """
+QPushButton {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                stop:0 #2196F3, stop:1 #1976D2);
+    border: 2px solid #42A5F5;
+    border-radius: 10px;
+    color: white;
+    padding: 8px 16px;
+}
+QPushButton:hover {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                stop:0 #42A5F5, stop:1 #2196F3);
+    border: 2px solid #64B5F6;
+}
+QPushButton:pressed {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                stop:0 #1976D2, stop:1 #1565C0);
+}
+"""
+
+# Stylesheet for the read-only project detail fields
+_FIELD_QSS = """
+QLineEdit {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+               stop:0 #3a3a3a, stop:1 #2d2d2d);
+    border: 2px solid #4dd0e1;
+    border-radius: 8px;
+    padding: 10px 15px;
+    color: #f0f0f0;
+    font-weight: 500;
+}
+QLineEdit:focus {
+    border-color: #66d9ef;
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+               stop:0 #404040, stop:1 #333333);
+}
+"""
+
+# Stylesheet for the filename structure box
+_FILENAME_QSS = """
+QTextEdit {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+               stop:0 #3a3a3a, stop:1 #2d2d2d);
+    border: 2px solid #4dd0e1;
+    border-radius: 8px;
+    padding: 12px 15px;
+    color: #f0f0f0;
+    font-weight: 500;
+}
+QTextEdit:focus {
+    border-color: #66d9ef;
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+               stop:0 #404040, stop:1 #333333);
+}
+"""
+
+# Stylesheet for the user manual box
+_MANUAL_QSS = """
+QTextEdit {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+                stop:0 #1e4a5c, stop:1 #21657E);
+    border: 2px solid #4dd0e1;
+    border-radius: 10px;
+    padding: 20px;
+    line-height: 1.6;
+    color: #f0f0f0;
+}
+"""
+
+# Stylesheet for the file progress table
+_TABLE_QSS = """
+QTableView {
+    background-color: #3c3f41;
+    border: 2px solid #555;
+    border-radius: 8px;
+    color: #f0f0f0;
+    gridline-color: #555;
+    font-size: 12pt;
+}
+"""
+
+
+@lru_cache(maxsize=1)
+def _status_table_styles() -> tuple[QFont, QFont, QBrush, dict[Status, QBrush]]:
+    """
+    Build the progress table's fonts and brushes once and share them across all cells.
+    
+    Created lazily on first use rather than at import, when no QApplication exists yet.
+    
+    Returns:
+        tuple: (filename font, status font, foreground brush, brushes keyed by Status)
+    """
+    return (
+        QFont("Segoe UI", 11, QFont.Normal),
+        QFont("Segoe UI", 11, QFont.Medium),
+        QBrush(QColor("#ffffff")),
+        {status: QBrush(color) for status, color in STATUS_COLORS_BY_ENUM.items()},
+    )
+
+
+class StatusTableModel(QAbstractTableModel):
+    """
+    Read-only table model over a project's {filename: Status} dict.
+    
+    The view only asks for the cells it paints, so no per-row items are
+    created; a refresh just swaps the row list and resets the model.
+    """
+    
+    FILENAME_COL = 0
+    STATUS_COL = 1
+    HEADERS = ("Filename", "Processing Status")
+    # Roles whose values depend on a row's status
+    STATUS_ROLES = [Qt.DisplayRole, Qt.BackgroundRole, Qt.ForegroundRole]
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: list[tuple[str, Status]] = []
+        self._filename_font, self._status_font, self._foreground, self._status_brushes = _status_table_styles()
+    
+    def set_status(self, status: Dict[str, Status]) -> bool:
+        """
+        Replace the displayed rows with the given status dict.
+        
+        When the same files are listed in the same order, only the rows whose
+        status changed are signalled; otherwise the model is reset.
+        
+        Returns:
+            bool: False if the rows were unchanged and the model was left alone
+        """
+        rows = list(status.items())
+        if rows == self._rows:
+            return False
+        
+        old_rows = self._rows
+        if len(rows) == len(old_rows) and all(new[0] == old[0] for new, old in zip(rows, old_rows)):
+            self._rows = rows
+            last_column = len(self.HEADERS) - 1
+            for row, (new, old) in enumerate(zip(rows, old_rows)):
+                if new[1] is not old[1]:
+                    self.dataChanged.emit(self.index(row, 0), self.index(row, last_column), self.STATUS_ROLES)
+            return True
+        
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+        return True
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        filename, status = self._rows[index.row()]
+        column = index.column()
+        
+        if role == Qt.DisplayRole:
+            # check_folders already keys the dict by file stem
+            return filename if column == self.FILENAME_COL else status.name
+        if role == Qt.BackgroundRole:
+            # The status color spans both filename and processing status columns
+            return self._status_brushes.get(status)
+        if role == Qt.ForegroundRole:
+            return self._foreground if status in self._status_brushes else None
+        if role == Qt.FontRole:
+            return self._filename_font if column == self.FILENAME_COL else self._status_font
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
 
 
 class ProjectManagementTab(QWidget):
@@ -51,8 +482,17 @@ class ProjectManagementTab(QWidget):
         # Initialize attributes that will be used by parent
         self.folder_path: Optional[str] = None
         self.status: Optional[Dict[str, Status]] = None
-        self.metrics_dataframe: Optional[DataFrame] = None
+        self.metrics_dataframe: Optional["DataFrame"] = None
         
+        # Last check_folders result, keyed by the (path, mtime) of every scanned folder
+        self._folder_cache: Optional[tuple[tuple, Dict[str, Status]]] = None
+        # Signals of the status scan in flight, and whether another was requested meanwhile
+        self._scan_signals: Optional[_StatusScanSignals] = None
+        self._rescan_pending = False
+        # Signals of the project load in flight; reports from superseded loads are ignored
+        self._load_signals: Optional[_ProjectLoadSignals] = None
+        self._load_progress: Optional[QProgressDialog] = None
+
         self.setup_ui()
         
     def setup_ui(self) -> None:
@@ -81,56 +521,18 @@ class ProjectManagementTab(QWidget):
         
         self.btn_create_project = QPushButton("🖊️ Create New Project")
         self.btn_create_project.setSizePolicy(QSizePolicy.Minimum, QSizePolicy.Fixed)
-        scaled_height = self.scaling_manager.scale_size(55)
-        if isinstance(scaled_height, tuple):
-            scaled_height = scaled_height[1]
+        scaled_height = self.scaling_manager.scale_int(55)
         self.btn_create_project.setMinimumHeight(scaled_height)
         font_size = self.scaling_manager.scale_font_size(12)
         self.btn_create_project.setFont(QFont("Segoe UI", font_size, QFont.Bold))
-        self.btn_create_project.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                            stop:0 #4CAF50, stop:1 #388E3C);
-                border: 2px solid #66BB6A;
-                border-radius: 10px;
-                color: white;
-                padding: 8px 16px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                            stop:0 #66BB6A, stop:1 #4CAF50);
-                border: 2px solid #81C784;
-            }
-            QPushButton:pressed {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                            stop:0 #388E3C, stop:1 #2E7D32);
-            }
-        """)
+        self.btn_create_project.setStyleSheet(_BTN_CREATE_QSS)
         self.btn_create_project.clicked.connect(self.create_project)
 
         self.btn_load_yaml = QPushButton("📂 Load Existing Project")
         self.btn_load_yaml.setSizePolicy(QSizePolicy.Minimum, QSizePolicy.Fixed)
         self.btn_load_yaml.setMinimumHeight(scaled_height)
         self.btn_load_yaml.setFont(QFont("Segoe UI", font_size, QFont.Bold))
-        self.btn_load_yaml.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                            stop:0 #2196F3, stop:1 #1976D2);
-                border: 2px solid #42A5F5;
-                border-radius: 10px;
-                color: white;
-                padding: 8px 16px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                            stop:0 #42A5F5, stop:1 #2196F3);
-                border: 2px solid #64B5F6;
-            }
-            QPushButton:pressed {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                            stop:0 #1976D2, stop:1 #1565C0);
-            }
-        """)
+        self.btn_load_yaml.setStyleSheet(_BTN_LOAD_QSS)
         self.btn_load_yaml.clicked.connect(self.load_yaml_file)
 
         button_layout.addWidget(self.btn_create_project)
@@ -147,6 +549,9 @@ class ProjectManagementTab(QWidget):
         self.number_of_videos = QLineEdit()
         self.filename_structure = QTextEdit()
 
+        # Same height, font and stylesheet for every detail field
+        field_height = self.scaling_manager.scale_int(40)
+        field_font = QFont("Segoe UI", self.scaling_manager.scale_font_size(12), QFont.Normal)
         for field in (
             self.project_name, 
             self.author_name, 
@@ -156,56 +561,19 @@ class ProjectManagementTab(QWidget):
         ):
             field.setReadOnly(True)
             field.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-            scaled_height = self.scaling_manager.scale_size(40)
-            if isinstance(scaled_height, tuple):
-                scaled_height = scaled_height[1]
-            field.setMinimumHeight(scaled_height)
-            field.setFont(QFont("Segoe UI", self.scaling_manager.scale_font_size(12), QFont.Normal))
-            field.setStyleSheet("""
-                QLineEdit {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
-                               stop:0 #3a3a3a, stop:1 #2d2d2d);
-                    border: 2px solid #4dd0e1;
-                    border-radius: 8px;
-                    padding: 10px 15px;
-                    color: #f0f0f0;
-                    font-weight: 500;
-                }
-                QLineEdit:focus {
-                    border-color: #66d9ef;
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
-                               stop:0 #404040, stop:1 #333333);
-                }
-            """)
+            field.setMinimumHeight(field_height)
+            field.setFont(field_font)
+            field.setStyleSheet(_FIELD_QSS)
 
         # Special formatting for filename structure field
         self.filename_structure.setReadOnly(True)
         self.filename_structure.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-        scaled_max_height = self.scaling_manager.scale_size(90)
-        scaled_min_height = self.scaling_manager.scale_size(40)
-        if isinstance(scaled_max_height, tuple):
-            scaled_max_height = scaled_max_height[1]
-        if isinstance(scaled_min_height, tuple):
-            scaled_min_height = scaled_min_height[1]
+        scaled_max_height = self.scaling_manager.scale_int(90)
+        scaled_min_height = self.scaling_manager.scale_int(40)
         self.filename_structure.setMaximumHeight(scaled_max_height)
         self.filename_structure.setMinimumHeight(scaled_min_height)
         self.filename_structure.setFont(QFont("Segoe UI", self.scaling_manager.scale_font_size(11), QFont.Normal))
-        self.filename_structure.setStyleSheet("""
-            QTextEdit {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
-                           stop:0 #3a3a3a, stop:1 #2d2d2d);
-                border: 2px solid #4dd0e1;
-                border-radius: 8px;
-                padding: 12px 15px;
-                color: #f0f0f0;
-                font-weight: 500;
-            }
-            QTextEdit:focus {
-                border-color: #66d9ef;
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
-                           stop:0 #404040, stop:1 #333333);
-            }
-        """)
+        self.filename_structure.setStyleSheet(_FILENAME_QSS)
 
         yaml_layout = QVBoxLayout()
         yaml_layout.setSpacing(5)
@@ -231,73 +599,19 @@ class ProjectManagementTab(QWidget):
         yaml_layout.addWidget(self.filename_structure)
         
         # Manual field with improved styling
-        manual_text = """📖 How to use this application:
-
-🎯 1. Project Management:
-   • Create a new project or load an existing one
-   • For new projects, fill in project details and select videos
-   • Configure filename structure for organized data
-   • Filename structure enables statistical analysis grouping
-
-🎬 2. Video Points Annotation:
-   • Switch to tab 2 after creating/loading a project
-   • Mark 4 corner points of the arena for each video:
-     - Top-left (red) • Top-right (green)
-     - Bottom-right (blue) • Bottom-left (orange)
-   • Use arrow keys to navigate between videos
-   • Press 'R' to reset points, 'S' to save progress
-   • Click 'Process data on computational cluster' when done
-   ⚠️ Note: This process may take a while!
-
-🔬 3. Tracking & Analysis:
-   • Switch to tab 3 after preprocessing is complete
-   • Click 'Run Tracking on Cluster' to start pose estimation
-   • Calculate behavioral metrics and view results
-   • Export trajectory visualizations and CSV data
-   ⚠️ Note: This process may take time (even days for large datasets)
-
-📊 4. Statistical Analysis:
-   • Switch to tab 4 after metrics are calculated
-   • Load CSV data with automatically parsed filename components
-   • Choose statistical test type:
-     - t-test: Compare 2 groups (e.g., Control vs Treatment)
-     - One-way ANOVA: Compare 2+ groups with one factor
-     - Two-way ANOVA: Analyze two factors + their interaction
-   • Select grouping factors from your filename structure
-   • Choose behavioral metrics to analyze
-   • View comprehensive results with significance testing
-   • Export publication-ready statistical reports
-
-💡 Tips:
-   • Ensure all videos are properly annotated before processing
-   • Check file status in the progress table below
-   • Use consistent lighting and camera angles for best results
-   • Plan filename structure carefully for statistical analysis
-   • Balance group sizes for optimal statistical power
-   • See Statistical Analysis Manual for detailed guidance
-        """
-        
         manual_label = QLabel("📋 User Manual")
         manual_label.setFont(QFont("Segoe UI", self.scaling_manager.scale_font_size(16), QFont.Bold))
         manual_label.setStyleSheet("color: #4dd0e1; margin-top: 20px; margin-bottom: 10px;")
         
         manual_field = QTextEdit()
         manual_field.setReadOnly(True)
-        manual_field.setText(manual_text)
+        # The manual is plain text, so skip Qt's rich text detection and HTML import
+        manual_field.setAcceptRichText(False)
+        manual_field.setPlainText(_MANUAL_TEXT)
         manual_field.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)  # Changed from Expanding to Preferred
         # Remove fixed height constraint - let it size naturally based on content
         manual_field.setFont(QFont("Segoe UI", self.scaling_manager.scale_font_size(11), QFont.Normal))
-        manual_field.setStyleSheet("""
-            QTextEdit {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1, 
-                            stop:0 #1e4a5c, stop:1 #21657E);
-                border: 2px solid #4dd0e1;
-                border-radius: 10px;
-                padding: 20px;
-                line-height: 1.6;
-                color: #f0f0f0;
-            }
-        """)
+        manual_field.setStyleSheet(_MANUAL_QSS)
         
         yaml_layout.addSpacerItem(QSpacerItem(0, 30))
         yaml_layout.addWidget(manual_label)
@@ -319,31 +633,27 @@ class ProjectManagementTab(QWidget):
         progress_label.setStyleSheet("color: #4dd0e1; margin-bottom: 15px;")
         right_layout.addWidget(progress_label)
 
-        self.table = QTableWidget()
-        self.table.setColumnCount(2)
-        self.table.setHorizontalHeaderLabels(["Filename", "Processing Status"])
+        self.status_model = StatusTableModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.status_model)
         self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.table.setSelectionMode(QAbstractItemView.SingleSelection)
-        scaled_table_height = self.scaling_manager.scale_size(500)
-        if isinstance(scaled_table_height, tuple):
-            scaled_table_height = scaled_table_height[1]
+        scaled_table_height = self.scaling_manager.scale_int(500)
         self.table.setMinimumHeight(scaled_table_height)
         
         # Hide row numbers in the vertical header
         vertical_header = self.table.verticalHeader()
         if vertical_header is not None:
             vertical_header.setVisible(False)
+        
+        # The status column fits its text and the filename column takes the rest;
+        # the header keeps this up to date on resizes and model changes by itself
+        horizontal_header = self.table.horizontalHeader()
+        horizontal_header.setStretchLastSection(False)
+        horizontal_header.setSectionResizeMode(StatusTableModel.FILENAME_COL, QHeaderView.Stretch)
+        horizontal_header.setSectionResizeMode(StatusTableModel.STATUS_COL, QHeaderView.ResizeToContents)
 
-        self.table.setStyleSheet("""
-                QTableWidget {
-                    background-color: #3c3f41;
-                    border: 2px solid #555;
-                    border-radius: 8px;
-                    color: #f0f0f0;
-                    gridline-color: #555;
-                    font-size: 12pt;
-                }"""
-            )
+        self.table.setStyleSheet(_TABLE_QSS)
 
         right_layout.addWidget(self.table)
 
@@ -357,18 +667,6 @@ class ProjectManagementTab(QWidget):
 
         self.setLayout(main_layout)
 
-    def resizeEvent(self, event):
-        """Handle resize events to maintain proportional column widths."""
-        super().resizeEvent(event)
-        if hasattr(self, 'table') and self.table:
-            # Calculate 60% and 40% of the table width
-            table_width = self.table.width() - 4  # Account for borders
-            if table_width > 0:
-                col1_width = int(table_width * 0.6)
-                col2_width = int(table_width * 0.4)
-                self.table.setColumnWidth(0, col1_width)
-                self.table.setColumnWidth(1, col2_width)
-
     def load_yaml_file(self) -> None:
         """Load an existing project from a YAML file."""
         file_path, _ = QFileDialog.getOpenFileName(
@@ -381,52 +679,59 @@ class ProjectManagementTab(QWidget):
         if not file_path:
             return
 
-        with open(file_path, "r") as f:
-            data = yaml.safe_load(f)
-            
+        # Parse the YAML, read the metrics CSV and scan the project folders on a
+        # pool thread; the GUI is updated in _on_project_loaded
+        if self._load_signals is not None:
+            # A newer selection supersedes a load still in flight
+            self._load_progress.close()
+        self._load_progress = QProgressDialog("Loading project...", None, 0, 0, self)
+        self._load_progress.setWindowTitle("Loading Project")
+        self._load_progress.setWindowModality(Qt.WindowModal)
+        self._load_progress.setMinimumDuration(200)  # Only show for slow loads
+        
+        task = _ProjectLoadTask(file_path)
+        task.signals.loaded.connect(self._on_project_loaded)
+        task.signals.failed.connect(self._on_project_load_failed)
+        self._load_signals = task.signals  # Keep the signal emitter alive until it reports
+        QThreadPool.globalInstance().start(task)
+
+    def _on_project_load_failed(self, error_message: str) -> None:
+        """Report a project that could not be loaded."""
+        if self.sender() is not self._load_signals:
+            return  # Superseded by a later load
+        self._load_progress.close()
+        self._load_signals = None
+        QMessageBox.critical(self, "Error", f"Failed to load project:\n{error_message}")
+
+    def _on_project_loaded(self, file_path: str, fields: dict[str, str], metrics_dataframe: Optional["DataFrame"],
+                           folder_scan: tuple) -> None:
+        """Populate the tab from a project loaded by _ProjectLoadTask."""
+        if self.sender() is not self._load_signals:
+            return  # Superseded by a later load
+        self._load_progress.close()
+        self._load_signals = None
+        
         self.yaml_path = file_path
         self.folder_path = os.path.dirname(file_path)
+        # Seed the status cache with the scan done on the pool thread
+        self._folder_cache = folder_scan
         
         # Update parent window attributes
         if self.parent_window:
             self.parent_window.yaml_path = self.yaml_path
             self.parent_window.folder_path = self.folder_path
         
-        metrics_dataframe_path = os.path.join(self.folder_path, Folder.RESULTS.value, "metrics_dataframe.csv")
-        if os.path.exists(metrics_dataframe_path):
-            self.metrics_dataframe = pd.read_csv(metrics_dataframe_path)
+        if metrics_dataframe is not None:
+            self.metrics_dataframe = metrics_dataframe
             if self.parent_window:
                 self.parent_window.metrics_dataframe = self.metrics_dataframe
 
-        # Update UI fields first
-        self.project_name.setText(str(data.get("project_name", "")))
-        self.author_name.setText(str(data.get("author", "")))
-        self.experiment_type.setText(str(data.get("experiment_type", "")))
-        
-        timestamp_str = str(data.get("creation_time", ""))
-        timestamp_formatted = datetime.fromisoformat(timestamp_str).strftime("%d.%m.%Y %H:%M")
-        self.creation_time.setText(timestamp_formatted)
-        
-        # Display filename structure information
-        filename_structure = data.get("filename_structure", {})
-        if filename_structure:
-            field_names = filename_structure.get("field_names", [])
-            num_fields = filename_structure.get("num_fields", len(field_names))
-            merge_groups = filename_structure.get("merge_groups", [])
-            
-            description = filename_structure.get("description", f"{num_fields} fields: " + " _ ".join(field_names))
-            
-            # Add merge groups information if they exist
-            if merge_groups:
-                description += "\n\nField Merging:"
-                for i, group in enumerate(merge_groups):
-                    group_names = [field_names[idx] for idx in group if idx < len(field_names)]
-                    merge_name = " + ".join(group_names)
-                    description += f"\n  Group {i+1}: {merge_name}"
-            
-            self.filename_structure.setText(description)
-        else:
-            self.filename_structure.setText("No filename structure defined")
+        # Update UI fields first; the text was prepared on the pool thread
+        self.project_name.setText(fields["project_name"])
+        self.author_name.setText(fields["author"])
+        self.experiment_type.setText(fields["experiment_type"])
+        self.creation_time.setText(fields["creation_time"])
+        self.filename_structure.setText(fields["filename_structure"])
         
         # Hide buttons immediately
         self.btn_load_yaml.setVisible(False)
@@ -459,6 +764,7 @@ class ProjectManagementTab(QWidget):
             try:
                 self.yaml_path = create_project_folder(dialog)
                 self.folder_path = str(Path(self.yaml_path).parent)
+                self.invalidate_status_cache()
                 
                 # Update parent window attributes
                 if self.parent_window:
@@ -506,66 +812,66 @@ class ProjectManagementTab(QWidget):
             self.btn_load_yaml.setVisible(False)
             self.btn_create_project.setVisible(False)
 
+    def invalidate_status_cache(self) -> None:
+        """Force the next update_progress_table call to rescan the project folders."""
+        self._folder_cache = None
+
     def update_progress_table(self) -> None:
-        """Update the progress table with current file statuses."""
+        """
+        Update the progress table with current file statuses.
+        
+        The folder scan runs on the global thread pool and the table is filled
+        when it reports back; requests made while a scan is running are
+        coalesced into a single follow-up scan.
+        """
         if not self.folder_path:
             return
-            
-        source_folder = os.path.join(str(self.folder_path), Folder.VIDEOS.value)
-        points_folder = os.path.join(str(self.folder_path), Folder.POINTS.value)
-        preprocessing_folder = os.path.join(str(self.folder_path), Folder.VIDEOS_PREPROCESSED.value)
-        tracking_folder = os.path.join(str(self.folder_path), Folder.TRACKING.value)
-        image_folder = os.path.join(str(self.folder_path), Folder.IMAGES.value)
-
-        self.status = check_folders(
-            source_folder, 
-            preprocessing_folder, 
-            tracking_folder, 
-            points_folder, 
-            image_folder
-        )
+        if self._scan_signals is not None:
+            self._rescan_pending = True
+            return
+        
+        task = _StatusScanTask(str(self.folder_path), self._folder_cache)
+        task.signals.done.connect(self._on_status_scanned)
+        task.signals.failed.connect(self._on_status_scan_failed)
+        self._scan_signals = task.signals  # Keep the signal emitter alive until it reports
+        QThreadPool.globalInstance().start(task)
+    
+    def _finish_status_scan(self) -> None:
+        """Release the finished scan and start the coalesced follow-up, if any."""
+        self._scan_signals = None
+        if self._rescan_pending:
+            self._rescan_pending = False
+            self.update_progress_table()
+    
+    def _on_status_scan_failed(self, error_message: str) -> None:
+        """Keep showing the last known statuses when the project folders cannot be scanned."""
+        logger.warning(f"Could not scan project folders: {error_message}")
+        self._finish_status_scan()
+    
+    def _on_status_scanned(self, folder_path: str, cache_key: tuple, status: Dict[str, Status]) -> None:
+        """Apply a finished folder scan to the progress table."""
+        # Drop results for a project that is no longer open
+        if folder_path == str(self.folder_path):
+            self._folder_cache = (cache_key, status)
+            self._apply_status(status)
+        self._finish_status_scan()
+    
+    def _apply_status(self, status: Dict[str, Status]) -> None:
+        """Show a status dict in the progress table and share it with the main window."""
+        # Hand out a copy; the status dict is updated in place by the metrics worker
+        self.status = dict(status)
         
         # Update parent window status
         if self.parent_window:
             self.parent_window.status = self.status
         
         self.number_of_videos.setText(str(len(self.status)))
-        self.table.setRowCount(len(self.status))
         
-        for row, (k, v) in enumerate(self.status.items()):
-            filename = Path(k).stem
-            
-            # Filename column
-            filename_item = QTableWidgetItem(filename)
-            filename_item.setFont(QFont("Segoe UI", 11, QFont.Normal))
-            self.table.setItem(row, 0, filename_item)
-            
-            # Processing status column
-            processing_item = QTableWidgetItem(v.name)
-            processing_item.setFont(QFont("Segoe UI", 11, QFont.Medium))
-            self.table.setItem(row, 1, processing_item)
-            
-        self.color_status_rows()
-        self.table.resizeColumnsToContents()
-
-    def color_status_rows(self) -> None:
-        """Apply background colors to rows in table based on processing status."""
-        for row in range(self.table.rowCount()):
-            # Color processing status (column 1)
-            processing_item = self.table.item(row, 1)
-            if processing_item:
-                status_text = processing_item.text().strip()
-                if status_text in STATUS_COLORS:
-                    color = STATUS_COLORS[status_text]
-                    # Apply color to both filename and processing status columns
-                    for col in [0, 1]:
-                        cell_item = self.table.item(row, col)
-                        if cell_item:
-                            # Force the background color by creating a new item with the color
-                            cell_text = cell_item.text()
-                            new_item = QTableWidgetItem(cell_text)
-                            new_item.setBackground(color)
-                            new_item.setForeground(QColor("#ffffff"))
-                            # Force the item to ignore stylesheets for background
-                            new_item.setFlags(cell_item.flags())
-                            self.table.setItem(row, col, new_item)
+        # The model reads rows straight from the status dict; cells are built on demand.
+        # Repaints stay suspended across the update so the table is painted once
+        table = self.table
+        table.setUpdatesEnabled(False)
+        try:
+            self.status_model.set_status(self.status)
+        finally:
+            table.setUpdatesEnabled(True)
@@ -2,14 +2,21 @@
 Automatic scaling utilities for different screen resolutions.
 """
 
+import re
 import sys
 from typing import Tuple, Union, Optional
-from PyQt5.QtWidgets import QApplication, QDesktopWidget
+from PyQt5.QtWidgets import QApplication
 from PyQt5.QtCore import QRect
+from PyQt5.QtGui import QScreen
 from utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Stylesheet declarations rewritten by get_scaled_stylesheet, compiled once
+_FONT_SIZE_RE = re.compile(r'font-size:\s*(\d+)(pt|px);')
+_PADDING_RE = re.compile(r'(padding:\s*)([^;{}]*?px[^;{}]*);')
+_PX_RE = re.compile(r'(\d+)px')
+
 
 class ScalingManager:
     """Manages automatic scaling for different screen resolutions."""
@@ -20,6 +27,40 @@ class ScalingManager:
         self._scale_factor = 1.0
         self._font_scale_factor = 1.0
         self._screen_rect: Optional[QRect] = None
+        # Screen whose availableGeometryChanged is connected; only the primary is watched
+        self._watched_screen: Optional[QScreen] = None
+        # Scaled results by input value; the factors are fixed once calculated
+        self._size_cache: dict = {}
+        self._font_size_cache: dict[int, int] = {}
+        self._calculate_scaling()
+        self._watch_screens()
+    
+    def _watch_screens(self) -> None:
+        """Recalculate the scaling only when the primary screen or its geometry changes."""
+        app = QApplication.instance()
+        if app is None:
+            return
+        app.primaryScreenChanged.connect(self._on_primary_screen_changed)
+        self._watch_screen(app.primaryScreen())
+    
+    def _watch_screen(self, screen: Optional[QScreen]) -> None:
+        """Move the geometry watch from the previously watched screen to this one."""
+        if self._watched_screen is not None:
+            try:
+                self._watched_screen.availableGeometryChanged.disconnect(self._on_screen_geometry_changed)
+            except (TypeError, RuntimeError):
+                pass  # Already disconnected, or the screen was unplugged and deleted
+        self._watched_screen = screen
+        if screen is not None:
+            screen.availableGeometryChanged.connect(self._on_screen_geometry_changed)
+    
+    def _on_primary_screen_changed(self, screen: Optional[QScreen]) -> None:
+        """Follow the new primary screen and rescale for it."""
+        self._watch_screen(screen)
+        self._calculate_scaling()
+    
+    def _on_screen_geometry_changed(self, _geometry: QRect) -> None:
+        """Rescale after the primary screen's available area changed."""
         self._calculate_scaling()
     
     def _calculate_scaling(self) -> None:
@@ -27,11 +68,14 @@ class ScalingManager:
         app = QApplication.instance()
         if app is None:
             return
+        screen = app.primaryScreen()
+        if screen is None:
+            return
             
-        # Get screen geometry using QDesktopWidget (PyQt5 compatible)
-        desktop = QDesktopWidget()
-        screen_rect = desktop.availableGeometry()
+        # Get screen geometry from the primary QScreen
+        screen_rect = screen.availableGeometry()
         self._screen_rect = screen_rect
+        previous_factors = (self._scale_factor, self._font_scale_factor)
         
         # Calculate scale factors
         width_scale = screen_rect.width() / self._base_width
@@ -48,6 +92,9 @@ class ScalingManager:
         
         # Font scaling should be slightly different to maintain readability
         self._font_scale_factor = max(0.8, min(1.3, self._scale_factor))
+        if (self._scale_factor, self._font_scale_factor) != previous_factors:
+            self._size_cache.clear()
+            self._font_size_cache.clear()
         
         if self._screen_rect is not None:
             logger.debug(f"Screen resolution: {self._screen_rect.width()}x{self._screen_rect.height()}")
@@ -71,17 +118,35 @@ class ScalingManager:
     
     def scale_size(self, size: Union[int, Tuple[int, int]]) -> Union[int, Tuple[int, int]]:
         """Scale a size value or tuple."""
-        if isinstance(size, tuple):
-            return (int(size[0] * self._scale_factor), int(size[1] * self._scale_factor))
-        return int(size * self._scale_factor)
+        scaled = self._size_cache.get(size)
+        if scaled is None:
+            if isinstance(size, tuple):
+                scaled = (int(size[0] * self._scale_factor), int(size[1] * self._scale_factor))
+            else:
+                scaled = int(size * self._scale_factor)
+            self._size_cache[size] = scaled
+        return scaled
+    
+    def scale_int(self, size: int) -> int:
+        """Scale a single length; unlike scale_size this never returns a tuple."""
+        scaled = self._size_cache.get(size)
+        if scaled is None:
+            scaled = int(size * self._scale_factor)
+            self._size_cache[size] = scaled
+        return scaled
     
     def scale_font_size(self, font_size: int) -> int:
         """Scale a font size."""
-        return max(8, int(font_size * self._font_scale_factor))
+        scaled = self._font_size_cache.get(font_size)
+        if scaled is None:
+            scaled = max(8, int(font_size * self._font_scale_factor))
+            self._font_size_cache[font_size] = scaled
+        return scaled
     
     def scale_position(self, pos: Tuple[int, int]) -> Tuple[int, int]:
         """Scale a position tuple."""
-        return (int(pos[0] * self._scale_factor), int(pos[1] * self._scale_factor))
+        # Positions scale exactly like size tuples, so they share the cache
+        return self.scale_size(tuple(pos))
     
     def get_scaled_button_size(self, base_width: int, base_height: int) -> Tuple[int, int]:
         """Get scaled button size."""
@@ -109,46 +174,17 @@ class ScalingManager:
         return self._screen_rect.width() < 1600 or self._screen_rect.height() < 900
     
     def get_scaled_stylesheet(self, base_stylesheet: str) -> str:
-        """Scale font sizes in a stylesheet."""
-        lines = base_stylesheet.split('\n')
-        scaled_lines = []
-        
-        for line in lines:
-            if 'font-size:' in line:
-                # Extract font size and scale it
-                parts = line.split('font-size:')
-                if len(parts) == 2:
-                    size_part = parts[1].strip()
-                    if size_part.endswith('pt;'):
-                        try:
-                            size = int(size_part[:-3])
-                            scaled_size = self.scale_font_size(size)
-                            line = parts[0] + f'font-size: {scaled_size}pt;'
-                        except ValueError:
-                            pass
-                    elif size_part.endswith('px;'):
-                        try:
-                            size = int(size_part[:-3])
-                            scaled_size = self.scale_font_size(size)
-                            line = parts[0] + f'font-size: {scaled_size}px;'
-                        except ValueError:
-                            pass
-            elif 'padding:' in line and 'px' in line:
-                # Scale padding values
-                parts = line.split('padding:')
-                if len(parts) == 2:
-                    padding_part = parts[1].strip()
-                    if padding_part.endswith('px;'):
-                        try:
-                            padding = int(padding_part[:-3])
-                            scaled_padding = int(padding * self._scale_factor)
-                            line = parts[0] + f'padding: {scaled_padding}px;'
-                        except ValueError:
-                            pass
-            
-            scaled_lines.append(line)
-        
-        return '\n'.join(scaled_lines)
+        """Scale font sizes and pixel paddings in a stylesheet."""
+        # Extract font size and scale it
+        scaled = _FONT_SIZE_RE.sub(
+            lambda m: f'font-size: {self.scale_font_size(int(m.group(1)))}{m.group(2)};',
+            base_stylesheet
+        )
+        # Scale padding values, including every side of a multi-value padding
+        return _PADDING_RE.sub(
+            lambda m: m.group(1) + _PX_RE.sub(lambda px: f'{self.scale_size(int(px.group(1)))}px', m.group(2)) + ';',
+            scaled
+        )
 
 
 # Global scaling manager instance
@@ -168,6 +204,11 @@ def scale_size(size: Union[int, Tuple[int, int]]) -> Union[int, Tuple[int, int]]
     return get_scaling_manager().scale_size(size)
 
 
+def scale_int(size: int) -> int:
+    """Convenience function to scale a single length."""
+    return get_scaling_manager().scale_int(size)
+
+
 def scale_font_size(font_size: int) -> int:
     """Convenience function to scale a font size."""
     return get_scaling_manager().scale_font_size(font_size)
@@ -10,6 +10,10 @@ from typing import Optional, Dict, List, Tuple, Any
 import pandas as pd
 import numpy as np
 from pandas import DataFrame
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as YamlLoader
 try:
     import statsmodels.api as sm
     from statsmodels.formula.api import ols
@@ -40,6 +44,7 @@ except ImportError:
 
 from file_management.folders import Folder
 from gui.scaling import get_scaling_manager
+from metric_calculation.utils import load_metric_dataframe
 
 
 class StatisticalAnalysisWorker(QThread):
@@ -346,12 +351,12 @@ class StatisticalAnalysisTab(QWidget):
         
         self.load_data_btn = QPushButton("Load Current Project")
         self.load_data_btn.clicked.connect(self.load_current_project_data)
-        self.load_data_btn.setMinimumHeight(self.scaling_manager.scale_size(40)) # type: ignore
+        self.load_data_btn.setMinimumHeight(self.scaling_manager.scale_int(40))
         data_layout.addWidget(self.load_data_btn)
         
         self.load_multiple_btn = QPushButton("Load Multiple Projects")
         self.load_multiple_btn.clicked.connect(self.load_multiple_projects_data)
-        self.load_multiple_btn.setMinimumHeight(self.scaling_manager.scale_size(40)) # type: ignore
+        self.load_multiple_btn.setMinimumHeight(self.scaling_manager.scale_int(40))
         data_layout.addWidget(self.load_multiple_btn)
         
         self.data_status_label = QLabel("No data loaded")
@@ -437,7 +442,7 @@ class StatisticalAnalysisTab(QWidget):
         # Analysis button
         self.analyze_btn = QPushButton("🔬 Run Analysis")
         self.analyze_btn.clicked.connect(self.run_analysis)
-        self.analyze_btn.setMinimumHeight(self.scaling_manager.scale_size(50)) # pyright: ignore[reportArgumentType]
+        self.analyze_btn.setMinimumHeight(self.scaling_manager.scale_int(50))
         self.analyze_btn.setEnabled(False)
         self.analyze_btn.setStyleSheet("""
             QPushButton {
@@ -589,19 +594,19 @@ class StatisticalAnalysisTab(QWidget):
             folder_path = self.parent_window.folder_path
             yaml_path = self.parent_window.yaml_path
             
-            # Load CSV data
-            csv_path = os.path.join(folder_path, Folder.RESULTS.value, "metrics_dataframe.csv")
-            if not os.path.exists(csv_path):
+            # Load metrics data
+            metrics_dataframe = load_metric_dataframe(os.path.join(folder_path, Folder.RESULTS.value))
+            if metrics_dataframe is None:
                 QMessageBox.warning(self, "Warning", 
                     "No metrics data found. Please run tracking and calculate metrics first.")
                 return
             
-            self.metrics_dataframe = pd.read_csv(csv_path)
+            self.metrics_dataframe = metrics_dataframe
             
             # Load YAML configuration
             if yaml_path and os.path.exists(yaml_path):
-                with open(yaml_path, 'r') as f:
-                    self.yaml_config = yaml.safe_load(f)
+                with open(yaml_path, 'rb') as f:
+                    self.yaml_config = yaml.load(f, Loader=YamlLoader)
             
             # Extract grouping factors from filename structure
             self.extract_grouping_factors()
@@ -640,8 +645,8 @@ class StatisticalAnalysisTab(QWidget):
             for yaml_path in selected_files:
                 try:
                     # Load YAML configuration
-                    with open(yaml_path, 'r') as f:
-                        config = yaml.safe_load(f)
+                    with open(yaml_path, 'rb') as f:
+                        config = yaml.load(f, Loader=YamlLoader)
                     
                     # Get project folder (parent of config.yaml)
                     project_folder = os.path.dirname(yaml_path)
@@ -659,14 +664,12 @@ class StatisticalAnalysisTab(QWidget):
                             return
                     
                     # Load metrics data from this project
-                    csv_path = os.path.join(project_folder, Folder.RESULTS.value, "metrics_dataframe.csv")
-                    if not os.path.exists(csv_path):
+                    df = load_metric_dataframe(os.path.join(project_folder, Folder.RESULTS.value))
+                    if df is None:
                         QMessageBox.warning(self, "Warning", 
                             f"No metrics data found in project '{project_name}'. Skipping this project.")
                         continue
                     
-                    df = pd.read_csv(csv_path)
-                    
                     # Add project identifier column
                     df['Project'] = project_name
                     all_dataframes.append(df)
@@ -1412,8 +1415,8 @@ class StatisticalAnalysisTab(QWidget):
                 # Also get the YAML config
                 if hasattr(self.parent_window, 'yaml_path') and self.parent_window.yaml_path:
                     try:
-                        with open(self.parent_window.yaml_path, 'r') as f:
-                            self.yaml_config = yaml.safe_load(f)
+                        with open(self.parent_window.yaml_path, 'rb') as f:
+                            self.yaml_config = yaml.load(f, Loader=YamlLoader)
                     except Exception:
                         # Silently handle YAML loading errors to prevent dialog flashes
                         pass
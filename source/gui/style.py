@@ -3,6 +3,8 @@ GUI styling and constants for the Pipeline Application.
 """
 from PyQt5.QtGui import QColor
 
+from file_management.status import Status
+
 
 def get_scaled_dark_style() -> str:
     """Get the dark style with scaled font sizes based on screen resolution."""
@@ -402,3 +404,8 @@ STATUS_COLORS = {
     "RESULTS_DONE": QColor("#006633"),     # Deep green
     "ERROR": QColor("#7D0000")             # Red
 }
+
+# Same colors keyed by the Status enum, for lookups straight from status values
+STATUS_COLORS_BY_ENUM = {
+    status: STATUS_COLORS[status.name] for status in Status if status.name in STATUS_COLORS
+}
@@ -72,9 +72,7 @@ class VideoPointsAnnotationTab(QWidget):
             }
         """)
         btn_cluster.setSizePolicy(QSizePolicy.Minimum, QSizePolicy.Fixed)
-        scaled_height = self.scaling_manager.scale_size(60)
-        if isinstance(scaled_height, tuple):
-            scaled_height = scaled_height[1]
+        scaled_height = self.scaling_manager.scale_int(60)
         btn_cluster.setMinimumHeight(scaled_height)
 
         btn_layout.addWidget(btn_cluster)
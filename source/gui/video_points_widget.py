@@ -64,9 +64,7 @@ class VideoPointsWidget(QWidget):
         self.btn_save = QPushButton("Save")
         
         # Scale buttons based on screen size
-        btn_height = self.scaling_manager.scale_size(40)
-        if isinstance(btn_height, tuple):
-            btn_height = btn_height[1]
+        btn_height = self.scaling_manager.scale_int(40)
         
         for btn in [self.btn_prev, self.btn_next, self.btn_save]:
             btn.setMinimumHeight(btn_height)
@@ -127,9 +125,7 @@ class VideoPointsWidget(QWidget):
         # Video list widget for direct access
         self.video_list = QListWidget()
         # Scale the video list width (increased from 300 to 400)
-        list_width = self.scaling_manager.scale_size(600)
-        if isinstance(list_width, tuple):
-            list_width = list_width[0]
+        list_width = self.scaling_manager.scale_int(600)
         self.video_list.setMaximumWidth(list_width)
         self.video_list.itemClicked.connect(self.on_video_list_clicked)
         
@@ -34,7 +34,7 @@ from gui.style import get_scaled_dark_style
 from gui.tracking_results_tab import TrackingResultsTab
 from gui.video_points_annotation_tab import VideoPointsAnnotationTab
 from metric_calculation.metrics_pipeline import run_metrics_pipeline
-from metric_calculation.utils import construct_metric_dataframe
+from metric_calculation.utils import construct_metric_dataframe, save_metric_dataframe
 from utils.logging_config import init_logging, get_logger
 from utils.settings_manager import reload_settings, set_project_path
 
@@ -427,10 +427,7 @@ class MainWindow(QMainWindow):
         # Generate dataframes and save results only if folder_path is valid
         if self.folder_path is not None:
             self.metrics_dataframe = construct_metric_dataframe(self.metrics, self.yaml_path)
-            self.metrics_dataframe.to_csv(
-                os.path.join(self.folder_path, Folder.RESULTS.value, "metrics_dataframe.csv"), 
-                index=False
-            )
+            save_metric_dataframe(self.metrics_dataframe, os.path.join(self.folder_path, Folder.RESULTS.value))
             self.metrics_dataframe.to_excel(
                 os.path.join(self.folder_path, Folder.RESULTS.value, "metrics_dataframe.xlsx"), 
                 index=False
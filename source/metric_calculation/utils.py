@@ -7,10 +7,18 @@ import yaml
 import pandas as pd
 from typing import Dict, Optional
 from pandas import DataFrame
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as YamlLoader
 from utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# File names of the saved metrics inside a project's results folder
+METRICS_CSV_NAME = "metrics_dataframe.csv"
+METRICS_PARQUET_NAME = "metrics_dataframe.parquet"
+
 
 def apply_merge_groups_to_columns(filename_columns: Dict[str, list], field_names: list[str], merge_groups: list[list[int]]) -> Dict[str, list]:
     """
@@ -90,8 +98,8 @@ def construct_metric_dataframe(metrics: Dict[str, Dict[str, float]], yaml_path:
     filename_columns = {}
     if yaml_path and os.path.exists(yaml_path):
         try:
-            with open(yaml_path, 'r') as f:
-                yaml_config = yaml.safe_load(f)
+            with open(yaml_path, 'rb') as f:
+                yaml_config = yaml.load(f, Loader=YamlLoader)
             
             filename_structure = yaml_config.get('filename_structure', {})
             field_names = filename_structure.get('field_names', [])
@@ -132,3 +140,62 @@ def construct_metric_dataframe(metrics: Dict[str, Dict[str, float]], yaml_path:
         data = {"Filename": filenames, **metrics_extracted}
     
     return pd.DataFrame(data)
+
+
+def save_metric_dataframe(metrics_dataframe: DataFrame, results_folder: str) -> None:
+    """
+    Save the metrics DataFrame to a project's results folder.
+    
+    The CSV stays the canonical copy; a Parquet copy is written next to it
+    when pyarrow is installed, which is much faster to load back.
+    
+    Args:
+        metrics_dataframe: Metrics as built by construct_metric_dataframe
+        results_folder: Project results folder
+    """
+    metrics_dataframe.to_csv(os.path.join(results_folder, METRICS_CSV_NAME), index=False)
+    try:
+        metrics_dataframe.to_parquet(os.path.join(results_folder, METRICS_PARQUET_NAME), engine="pyarrow", index=False)
+    except ImportError:  # pyarrow is an optional dependency
+        pass
+
+
+def load_metric_dataframe(results_folder: str) -> Optional[DataFrame]:
+    """
+    Load the metrics DataFrame from a project's results folder.
+    
+    Prefers the Parquet copy, but only while it is at least as new as the CSV
+    (the CSV may have been rewritten on a machine without pyarrow). The CSV
+    is parsed with pandas' multithreaded pyarrow engine when available.
+    
+    Args:
+        results_folder: Project results folder
+        
+    Returns:
+        Optional[DataFrame]: The metrics, or None if none have been saved
+    """
+    csv_path = os.path.join(results_folder, METRICS_CSV_NAME)
+    parquet_path = os.path.join(results_folder, METRICS_PARQUET_NAME)
+    csv_mtime = _mtime_ns(csv_path)
+    parquet_mtime = _mtime_ns(parquet_path)
+    
+    if parquet_mtime is not None and (csv_mtime is None or parquet_mtime >= csv_mtime):
+        try:
+            return pd.read_parquet(parquet_path, engine="pyarrow")
+        except ImportError:  # pyarrow is an optional dependency
+            pass
+    
+    if csv_mtime is None:
+        return None
+    try:
+        return pd.read_csv(csv_path, engine="pyarrow")
+    except ImportError:
+        return pd.read_csv(csv_path)
+
+
+def _mtime_ns(path: str) -> Optional[int]:
+    """Return a file's modification time, or None if it does not exist."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
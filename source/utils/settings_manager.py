@@ -3,15 +3,27 @@ Settings manager for pipeline configuration.
 """
 
 import json
+import math
 import os
-from typing import Dict, Any, Optional
+import threading
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional dependency; json is the fallback
+    orjson = None
+
 from file_management.folders import PROJECT_FOLDER
 
 # Load environment variables
 load_dotenv()
 
+# Settings whose infinite value means "no limit"; the file stores them as null,
+# which both json and orjson can express
+_UNBOUNDED_SETTINGS = ("max_time_minutes", "viz_end_time")
+
 
 class SettingsManager:
     """Singleton class to manage pipeline settings."""
@@ -19,6 +31,11 @@ class SettingsManager:
     _instance: Optional['SettingsManager'] = None
     _settings: Dict[str, Any] = {}
     _current_project_path: Optional[str] = None
+    # Parsed contents of the last settings file read or written, keyed by path and mtime.
+    # The mtime is None while staged settings wait for write_settings_file
+    _file_cache: Optional[Tuple[str, Optional[int], Dict[str, Any]]] = None
+    _cache_lock = threading.Lock()
+    _write_lock = threading.Lock()
     
     def __new__(cls) -> 'SettingsManager':
         if cls._instance is None:
@@ -28,52 +45,7 @@ class SettingsManager:
     
     def get_default_settings(self) -> Dict[str, Any]:
         """Get default settings for all parameters."""
-        return {
-            # Arena and general parameters
-            "arena_side_cm": 80.0,
-            "arena_size_px": 1000,
-            "corner_px": 100,
-            
-            # Body size calculation
-            "body_size_mode": "auto",  # "auto" or "manual"
-            "manual_body_size": 1.0,
-            "body_size_detection_threshold": 0.9,
-            "body_size_on_line_threshold": 0.25,
-            
-            # Head size calculation
-            "head_size_mode": "auto",  # "auto" or "manual"
-            "manual_head_size": 1.0,
-            
-            # Trajectory processing
-            "trajectory_detection_threshold": 0.6,
-            "motion_blur_sigma": 2.0,
-            "velocity_threshold": 1.0,
-            
-            # Thigmotaxis calculation
-            "thigmotaxis_bin_count": 25,
-            
-            # Time-based metrics
-            "timebin_minutes": 5.0,
-            "max_time_minutes": float('inf'),
-            
-            # Visualization
-            "viz_border_size": 8,
-            "viz_start_time": 0.0,
-            "viz_end_time": float('inf'),
-            "viz_enabled": True,  # Enable/disable trajectory plotting
-            "viz_retry_attempts": 3,  # Number of retry attempts for saving plots
-            
-            # Cluster removal
-            "cluster_removal_enabled": True,
-            "min_cluster_size_seconds": 1.0,
-            "cluster_padding_factor": 0.2,  # Was cluster_size // 5, now 20% of cluster size
-            
-            ## SSH (loaded from environment variables)
-            "ssh_host": os.getenv("SSH_HOST", "sup200.ad.nudz.cz"),
-            "ssh_port": int(os.getenv("SSH_PORT", "22")),
-            "ssh_user": os.getenv("SSH_USER", ""),
-            "ssh_password": os.getenv("SSH_PASS", "")
-        }
+        return dict(_default_settings())
     
     def _load_settings(self, project_path: Optional[str] = None) -> None:
         """Load settings from file."""
@@ -81,18 +53,41 @@ class SettingsManager:
             self._current_project_path = project_path
         
         settings_path = self._get_settings_path()
-        if os.path.exists(settings_path):
-            try:
-                with open(settings_path, 'r') as f:
-                    loaded_settings = json.load(f)
-                
-                # Merge with defaults to ensure all keys exist
-                self._settings = self.get_default_settings()
-                self._settings.update(loaded_settings)
-            except Exception:
-                self._settings = self.get_default_settings()
-        else:
-            self._settings = self.get_default_settings()
+        try:
+            loaded_settings = self._read_settings_file(settings_path)
+        except Exception:
+            loaded_settings = None
+        
+        # Merge with defaults to ensure all keys exist
+        self._settings = self.get_default_settings()
+        if loaded_settings is not None:
+            self._settings.update(loaded_settings)
+    
+    def _read_settings_file(self, settings_path: str) -> Optional[Dict[str, Any]]:
+        """
+        Parse a settings file, reusing the cached contents while its mtime is unchanged.
+        
+        Returns:
+            The file's settings (or the settings staged for it), or None if there are none
+        """
+        with self._cache_lock:
+            cache = self._file_cache
+        if cache is not None and cache[0] == settings_path and cache[1] is None:
+            # Staged settings are newer than anything on disk
+            return cache[2].copy()
+        
+        mtime_ns = _mtime_ns(settings_path)
+        if mtime_ns is None:
+            return None
+        if cache is not None and cache[0] == settings_path and cache[1] == mtime_ns:
+            return cache[2].copy()
+        
+        with open(settings_path, 'rb') as f:
+            loaded_settings = _decode_settings(f.read())
+        with self._cache_lock:
+            if self._file_cache is cache:
+                self._file_cache = (settings_path, mtime_ns, loaded_settings)
+        return loaded_settings.copy()
     
     def _get_settings_path(self) -> str:
         """Get the path to the settings file."""
@@ -106,6 +101,15 @@ class SettingsManager:
                 os.makedirs(PROJECT_FOLDER)
             return os.path.join(PROJECT_FOLDER, "pipeline_settings.json")
     
+    def has_settings_file(self) -> bool:
+        """Check whether the current settings file exists or a save to it is pending."""
+        settings_path = self._get_settings_path()
+        with self._cache_lock:
+            cache = self._file_cache
+        if cache is not None and cache[0] == settings_path and cache[1] is None:
+            return True
+        return os.path.exists(settings_path)
+    
     def get_setting(self, key: str, default: Any = None) -> Any:
         """Get a specific setting value."""
         return self._settings.get(key, default)
@@ -116,6 +120,8 @@ class SettingsManager:
     
     def reload_settings(self, project_path: Optional[str] = None) -> None:
         """Reload settings from file."""
+        # An explicit reload also picks up SSH environment variables changed since startup
+        _default_settings.cache_clear()
         self._load_settings(project_path)
     
     def set_project_path(self, project_path: Optional[str]) -> None:
@@ -125,14 +131,153 @@ class SettingsManager:
     
     def save_settings(self, settings: Dict[str, Any]) -> None:
         """Save settings to file."""
+        staged = self.stage_settings(settings)
+        if staged is not None:
+            self.write_settings_file(*staged)
+    
+    def stage_settings(self, settings: Dict[str, Any]) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """
+        Apply settings in memory ahead of writing them to the settings file.
+        
+        Until write_settings_file has stored them, reloading returns the staged
+        settings rather than the older file, so the write can run off the GUI thread.
+        
+        Returns:
+            The settings file path and the snapshot to pass to write_settings_file,
+            or None if the file already holds exactly these settings
+        """
         self._settings = settings
         settings_path = self._get_settings_path()
+        snapshot = dict(settings)
+        with self._cache_lock:
+            cache = self._file_cache
+            if (cache is not None and cache[0] == settings_path and cache[1] is not None
+                    and cache[2] == snapshot and _mtime_ns(settings_path) == cache[1]):
+                return None
+            self._file_cache = (settings_path, None, snapshot)
+        return settings_path, snapshot
+    
+    def write_settings_file(self, settings_path: str, snapshot: Dict[str, Any]) -> None:
+        """Write settings staged by stage_settings to disk; safe to call from a worker thread."""
+        with self._write_lock:
+            with self._cache_lock:
+                cache = self._file_cache
+            if cache is None or cache[2] is not snapshot:
+                # Superseded by a newer stage_settings call, which writes its own snapshot
+                return
+            
+            # Write beside the file and swap it in, so readers never see a partial file
+            temp_path = settings_path + ".tmp"
+            try:
+                # Ensure directory exists
+                os.makedirs(os.path.dirname(settings_path), exist_ok=True)
+                
+                with open(temp_path, 'wb') as f:
+                    f.write(_encode_settings(snapshot))
+                    # Make the contents durable before the rename publishes them
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temp_path, settings_path)
+                mtime_ns = os.stat(settings_path).st_mtime_ns
+            except Exception:
+                if os.path.isfile(temp_path):
+                    os.remove(temp_path)
+                with self._cache_lock:
+                    if self._file_cache is cache:
+                        self._file_cache = None
+                raise
+            
+            # The written dict is what the next read would parse
+            with self._cache_lock:
+                if self._file_cache is cache:
+                    self._file_cache = (settings_path, mtime_ns, snapshot)
+
+
+@lru_cache(maxsize=1)
+def _default_settings() -> Dict[str, Any]:
+    """Build the default settings once; the SSH values come from the environment loaded at import."""
+    return {
+        # Arena and general parameters
+        "arena_side_cm": 80.0,
+        "arena_size_px": 1000,
+        "corner_px": 100,
+        
+        # Body size calculation
+        "body_size_mode": "auto",  # "auto" or "manual"
+        "manual_body_size": 1.0,
+        "body_size_detection_threshold": 0.9,
+        "body_size_on_line_threshold": 0.25,
+        
+        # Head size calculation
+        "head_size_mode": "auto",  # "auto" or "manual"
+        "manual_head_size": 1.0,
         
-        # Ensure directory exists
-        os.makedirs(os.path.dirname(settings_path), exist_ok=True)
+        # Trajectory processing
+        "trajectory_detection_threshold": 0.6,
+        "motion_blur_sigma": 2.0,
+        "velocity_threshold": 1.0,
         
-        with open(settings_path, 'w') as f:
-            json.dump(self._settings, f, indent=2)
+        # Thigmotaxis calculation
+        "thigmotaxis_bin_count": 25,
+        
+        # Time-based metrics
+        "timebin_minutes": 5.0,
+        "max_time_minutes": math.inf,
+        
+        # Visualization
+        "viz_border_size": 8,
+        "viz_start_time": 0.0,
+        "viz_end_time": math.inf,
+        "viz_enabled": True,  # Enable/disable trajectory plotting
+        "viz_retry_attempts": 3,  # Number of retry attempts for saving plots
+        
+        # Cluster removal
+        "cluster_removal_enabled": True,
+        "min_cluster_size_seconds": 1.0,
+        "cluster_padding_factor": 0.2,  # Was cluster_size // 5, now 20% of cluster size
+        
+        ## SSH (loaded from environment variables)
+        "ssh_host": os.getenv("SSH_HOST", "sup200.ad.nudz.cz"),
+        "ssh_port": int(os.getenv("SSH_PORT", "22")),
+        "ssh_user": os.getenv("SSH_USER", ""),
+        "ssh_password": os.getenv("SSH_PASS", "")
+    }
+
+
+def _decode_settings(data: bytes) -> Dict[str, Any]:
+    """Parse the contents of a settings file."""
+    if orjson is not None:
+        try:
+            settings = orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # Older files spell the unbounded limits as Infinity, which only json accepts
+            settings = json.loads(data)
+    else:
+        settings = json.loads(data)
+    
+    for key in _UNBOUNDED_SETTINGS:
+        if key in settings and settings[key] is None:
+            settings[key] = math.inf
+    return settings
+
+
+def _encode_settings(settings: Dict[str, Any]) -> bytes:
+    """Serialize settings for the settings file."""
+    stored = {
+        key: None if key in _UNBOUNDED_SETTINGS and math.isinf(value) else value
+        for key, value in settings.items()
+    }
+    if orjson is not None:
+        return orjson.dumps(stored, option=orjson.OPT_INDENT_2)
+    return json.dumps(stored, indent=2).encode()
+
+
+def _mtime_ns(path: str) -> Optional[int]:
+    """Modification time of a file in nanoseconds, or None if it does not exist."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
 
 
 # Global instance